@@ -4,6 +4,7 @@ UI Components module for MedTranscribe application
 
 from .ui_components import (
     render_session_card,
+    render_session_list,
     render_audio_player,
     render_upload_form,
     render_stats_cards
@@ -11,7 +12,8 @@ from .ui_components import (
 
 __all__ = [
     'render_session_card',
-    'render_audio_player', 
+    'render_session_list',
+    'render_audio_player',
     'render_upload_form',
     'render_stats_cards'
-] 
\ No newline at end of file
+]
\ No newline at end of file
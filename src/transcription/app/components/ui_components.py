@@ -7,18 +7,61 @@ from typing import Dict, Any, List, Optional
 import time
 import base64
 
-from ..utils.helpers import format_file_size, format_timestamp, encode_audio_for_html, parse_transcription_text, create_text_export
+from ..utils.helpers import (
+    format_file_size, format_timestamp, ensure_audio_cached,
+    parse_transcription_text, create_text_export, messages_to_soa, MessagesSoA
+)
 
 
-def render_whatsapp_chat(messages: List[Dict[str, Any]], session_data: Dict[str, Any] = None) -> None:
-    """
-    Render WhatsApp-style chat interface for conversation transcription
-    
-    Args:
-        messages: List of message dictionaries with speaker, text, is_doctor
-        session_data: Session information for context
+@st.cache_data(show_spinner=False)
+def _build_chat_html(message_rows: tuple) -> str:
+    """Build the chat container HTML once per unique message list
+
+    Cached so reruns that don't touch the conversation reuse the
+    previously built HTML instead of re-rendering every message.
     """
-    st.markdown("""
+    chat_html = '<div class="chat-container">'
+
+    # Compute fallback timestamp once instead of per-message
+    default_timestamp = datetime.now().strftime('%H:%M')
+
+    for is_doctor, text, timestamp in message_rows:
+        speaker_class = 'doctor' if is_doctor else 'patient'
+        avatar_emoji = '👨‍⚕️' if is_doctor else '🧑‍🤝‍🧑'
+        avatar_class = 'doctor-avatar' if is_doctor else 'patient-avatar'
+
+        # Escape HTML
+        text = text.replace('<', '&lt;').replace('>', '&gt;')
+
+        timestamp = timestamp or default_timestamp
+
+        if is_doctor:
+            chat_html += f"""
+            <div class="message {speaker_class}">
+                <div class="message-bubble">
+                    {text}
+                    <div class="message-time">{timestamp}</div>
+                </div>
+                <div class="speaker-avatar {avatar_class}">{avatar_emoji}</div>
+            </div>
+            """
+        else:
+            chat_html += f"""
+            <div class="message {speaker_class}">
+                <div class="speaker-avatar {avatar_class}">{avatar_emoji}</div>
+                <div class="message-bubble">
+                    {text}
+                    <div class="message-time">{timestamp}</div>
+                </div>
+            </div>
+            """
+
+    chat_html += '</div>'
+    return chat_html
+
+
+# WhatsApp-style chat CSS, built once at import time
+_CHAT_CSS = """
     <style>
     .chat-container {
         max-height: 500px;
@@ -124,12 +167,26 @@ def render_whatsapp_chat(messages: List[Dict[str, Any]], session_data: Dict[str,
         to { opacity: 1; transform: translateY(0); }
     }
     </style>
-    """, unsafe_allow_html=True)
-    
-    if not messages:
+    """
+
+
+def render_whatsapp_chat(messages: List[Dict[str, Any]], session_data: Dict[str, Any] = None) -> None:
+    """
+    Render WhatsApp-style chat interface for conversation transcription
+
+    Args:
+        messages: List of message dictionaries with speaker, text, is_doctor
+        session_data: Session information for context
+    """
+    st.markdown(_CHAT_CSS, unsafe_allow_html=True)
+
+    # Accept either list-of-dicts (back-compat) or struct-of-arrays form
+    soa = messages if isinstance(messages, MessagesSoA) else messages_to_soa(messages)
+
+    if not soa.text:
         st.info("📭 No conversation messages available")
         return
-    
+
     # Chat Header
     if session_data:
         st.markdown(f"""
@@ -142,80 +199,42 @@ def render_whatsapp_chat(messages: List[Dict[str, Any]], session_data: Dict[str,
         """, unsafe_allow_html=True)
         
         # Chat Stats
-        doctor_count = sum(1 for msg in messages if msg.get('is_doctor', False))
-        patient_count = len(messages) - doctor_count
-        
+        doctor_count = sum(1 for is_doctor in soa.is_doctor if is_doctor)
+        patient_count = len(soa.is_doctor) - doctor_count
+
         st.markdown(f"""
         <div class="chat-stats">
             <span>👨‍⚕️ Doctor: {doctor_count} messages</span>
             <span>🧑‍🤝‍🧑 Patient: {patient_count} messages</span>
-            <span>💬 Total: {len(messages)} messages</span>
+            <span>💬 Total: {len(soa.is_doctor)} messages</span>
         </div>
         """, unsafe_allow_html=True)
     
-    # Chat Messages
-    chat_html = '<div class="chat-container">'
-    
-    for i, message in enumerate(messages):
-        is_doctor = message.get('is_doctor', False)
-        speaker_class = 'doctor' if is_doctor else 'patient'
-        avatar_emoji = '👨‍⚕️' if is_doctor else '🧑‍🤝‍🧑'
-        avatar_class = 'doctor-avatar' if is_doctor else 'patient-avatar'
-        
-        # Clean and format message text
-        text = message.get('text', '').strip()
-        if not text:
-            continue
-            
-        # Escape HTML
-        text = text.replace('<', '&lt;').replace('>', '&gt;')
-        
-        timestamp = message.get('timestamp', datetime.now().strftime('%H:%M'))
-        
-        if is_doctor:
-            chat_html += f"""
-            <div class="message {speaker_class}">
-                <div class="message-bubble">
-                    {text}
-                    <div class="message-time">{timestamp}</div>
-                </div>
-                <div class="speaker-avatar {avatar_class}">{avatar_emoji}</div>
-            </div>
-            """
-        else:
-            chat_html += f"""
-            <div class="message {speaker_class}">
-                <div class="speaker-avatar {avatar_class}">{avatar_emoji}</div>
-                <div class="message-bubble">
-                    {text}
-                    <div class="message-time">{timestamp}</div>
-                </div>
-            </div>
-            """
-    
-    chat_html += '</div>'
-    
-    st.markdown(chat_html, unsafe_allow_html=True)
+    # Chat Messages - hashable rows so the HTML build is cache-keyed on content
+    message_rows = tuple(
+        row for row in zip(soa.is_doctor, soa.text, soa.timestamp) if row[1]
+    )
+
+    st.markdown(_build_chat_html(message_rows), unsafe_allow_html=True)
 
 
-def render_enhanced_session_details(session: Any, unique_id: str = None) -> None:
+def render_enhanced_session_details(session: Any) -> None:
     """
     Render enhanced session details with audio player and chat interface
-    
+
     Args:
         session: Session object with transcription data
-        unique_id: Unique identifier for UI elements
+
+    All widget keys derive from session.id alone - a time-derived suffix
+    would change per rerun, orphaning the session_state flags and losing
+    every click.
     """
-    if not unique_id:
-        unique_id = f"{session.id}_{int(time.time() * 1000)}"
-    
-    # Check if session is selected
-    session_key = f"selected_session_{unique_id}"
+    session_key = f"selected_session_{session.id}"
     if session_key not in st.session_state:
         st.session_state[session_key] = False
-    
+
     # Toggle button
-    if st.button(f"👁️ View Details", key=f"view_btn_{unique_id}"):
+    if st.button(f"👁️ View Details", key=f"view_btn_{session.id}"):
         st.session_state[session_key] = not st.session_state[session_key]
         st.rerun()
     
@@ -249,26 +268,26 @@ def render_enhanced_session_details(session: Any, unique_id: str = None) -> None
                 if hasattr(session, 'file_size') and session.file_size:
                     st.metric("File Size", format_file_size(session.file_size))
             
-            # Audio Player
+            # Audio Player (loaded lazily - audio blobs can be tens of MB)
             st.markdown("### 🎵 Audio Playback")
             try:
                 from ..services.database_service import db_service
-                audio_data = db_service.get_audio_data(session.id)
-                
+
+                audio_loaded_key = f"audio_loaded_{session.id}"
+                if not st.session_state.get(audio_loaded_key):
+                    if st.button("🎵 Load Audio Player", key=f"load_audio_{session.id}"):
+                        st.session_state[audio_loaded_key] = True
+                        st.rerun()
+
+                audio_data = db_service.get_audio_data(session.id) if st.session_state.get(audio_loaded_key) else None
+
                 if audio_data:
-                    audio_base64 = encode_audio_for_html(audio_data, session.audio_filename or "audio.mp3")
-                    st.markdown(f"""
-                    <div style="background: #f8f9fa; padding: 15px; border-radius: 10px; margin: 10px 0;">
-                        <audio controls style="width: 100%;">
-                            <source src="{audio_base64}" type="audio/mpeg">
-                            Your browser does not support the audio element.
-                        </audio>
-                        <p style="margin: 5px 0 0 0; font-size: 12px; color: #6c757d;">
-                            🎧 {session.audio_filename or 'Audio file'}
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
+                    # Serve the cached file instead of a base64 data URI to skip
+                    # re-encoding the blob on every rerun
+                    cached_path = ensure_audio_cached(session.id, audio_data, session.audio_filename or "audio.mp3")
+                    st.audio(str(cached_path))
+                    st.caption(f"🎧 {session.audio_filename or 'Audio file'}")
+                elif st.session_state.get(audio_loaded_key):
                     st.warning("🔇 Audio file not available")
             except Exception as e:
                 st.error(f"❌ Error loading audio: {str(e)}")
@@ -293,59 +312,72 @@ def render_enhanced_session_details(session: Any, unique_id: str = None) -> None
                     if messages:
                         # Render WhatsApp-style chat
                         render_whatsapp_chat(messages, session_data)
-                        
-                        # Download Options
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            # Download as Text
-                            text_export = create_text_export(session_data, messages)
-                            st.download_button(
-                                label="📄 Download as Text",
-                                data=text_export,
-                                file_name=f"transcript_{session.patient_name}_{session.session_date}.txt",
-                                mime="text/plain",
-                                key=f"download_txt_{unique_id}"
-                            )
-                        
-                        with col2:
-                            # Download Raw Transcript
-                            st.download_button(
-                                label="📋 Download Raw",
-                                data=transcription.transcription_text,
-                                file_name=f"raw_transcript_{session.patient_name}_{session.session_date}.txt",
-                                mime="text/plain",
-                                key=f"download_raw_{unique_id}"
-                            )
-                        
-                        with col3:
-                            # Export as JSON
-                            import json
-                            json_data = {
-                                'session': session_data,
-                                'messages': messages,
-                                'metadata': {
-                                    'confidence_score': getattr(transcription, 'confidence_score', None),
-                                    'processing_time': getattr(transcription, 'processing_time', None),
-                                    'generated_at': datetime.now().isoformat()
+
+                        # Download options - payloads are only built once the user
+                        # asks for them, not on every rerun
+                        # Stable session.id keys for the same reason as the
+                        # audio loader above: the toggle must survive reruns
+                        downloads_key = f"downloads_ready_{session.id}"
+                        if not st.session_state.get(downloads_key):
+                            if st.button("📦 Prepare Downloads", key=f"prepare_downloads_{session.id}"):
+                                st.session_state[downloads_key] = True
+                                st.rerun()
+                        else:
+                            col1, col2, col3 = st.columns(3)
+
+                            with col1:
+                                # Download as Text
+                                text_export = create_text_export(session_data, messages)
+                                st.download_button(
+                                    label="📄 Download as Text",
+                                    data=text_export,
+                                    file_name=f"transcript_{session.patient_name}_{session.session_date}.txt",
+                                    mime="text/plain",
+                                    key=f"download_txt_{session.id}"
+                                )
+
+                            with col2:
+                                # Download Raw Transcript
+                                st.download_button(
+                                    label="📋 Download Raw",
+                                    data=transcription.transcription_text,
+                                    file_name=f"raw_transcript_{session.patient_name}_{session.session_date}.txt",
+                                    mime="text/plain",
+                                    key=f"download_raw_{session.id}"
+                                )
+
+                            with col3:
+                                # Export as JSON - timestamp cached per session so the
+                                # payload is stable across reruns
+                                import json
+                                generated_at = st.session_state.setdefault(
+                                    f"gen_ts_{session.id}", datetime.now().isoformat()
+                                )
+                                json_data = {
+                                    'session': session_data,
+                                    'messages': messages,
+                                    'metadata': {
+                                        'confidence_score': getattr(transcription, 'confidence_score', None),
+                                        'processing_time': getattr(transcription, 'processing_time', None),
+                                        'generated_at': generated_at
+                                    }
                                 }
-                            }
-                            
-                            st.download_button(
-                                label="📊 Export JSON",
-                                data=json.dumps(json_data, indent=2),
-                                file_name=f"conversation_{session.patient_name}_{session.session_date}.json",
-                                mime="application/json",
-                                key=f"download_json_{unique_id}"
-                            )
-                    
+
+                                st.download_button(
+                                    label="📊 Export JSON",
+                                    data=json.dumps(json_data, indent=2),
+                                    file_name=f"conversation_{session.patient_name}_{session.session_date}.json",
+                                    mime="application/json",
+                                    key=f"download_json_{session.id}"
+                                )
+
                     else:
                         # Fallback to raw text
                         st.text_area(
                             "Raw Transcription",
                             transcription.transcription_text,
                             height=300,
-                            key=f"raw_text_{unique_id}"
+                            key=f"raw_text_{session.id}"
                         )
                         
                         st.download_button(
@@ -353,7 +385,7 @@ def render_enhanced_session_details(session: Any, unique_id: str = None) -> None
                             data=transcription.transcription_text,
                             file_name=f"transcript_{session.patient_name}_{session.session_date}.txt",
                             mime="text/plain",
-                            key=f"simple_download_{unique_id}"
+                            key=f"simple_download_{session.id}"
                         )
                     
                     # Transcription Stats
@@ -371,50 +403,99 @@ def render_enhanced_session_details(session: Any, unique_id: str = None) -> None
             
             # Close button
             st.markdown("---")
-            if st.button(f"🔙 Close Details", key=f"close_btn_{unique_id}"):
+            if st.button(f"🔙 Close Details", key=f"close_btn_{session.id}"):
                 st.session_state[session_key] = False
                 st.rerun()
 
 
+_STATUS_ICONS = {
+    'completed': '🟢',
+    'processing': '🟡',
+    'pending': '🔴',
+    'error': '❌'
+}
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _session_card_html(session_id: int, patient_name: str, doctor_name: str,
+                       session_date: str, duration_str: str, status: str,
+                       updated_at: str) -> str:
+    """Build session card header markup, cached per session version
+
+    updated_at participates in the cache key so stale entries are
+    replaced whenever the session changes.
+    """
+    icon = _STATUS_ICONS.get(status, '⚪')
+    duration_html = f"<div>⏰ {duration_str}</div>" if duration_str else ""
+
+    return f"""
+    <div style="display: flex; justify-content: space-between; align-items: flex-start; margin: 4px 0;">
+        <div style="flex: 3;">
+            <strong>{patient_name}</strong><br>
+            Dr. {doctor_name}
+        </div>
+        <div style="flex: 2;">
+            <div>📅 {session_date}</div>
+            {duration_html}
+        </div>
+        <div style="flex: 1;">{icon} {status.title()}</div>
+    </div>
+    """
+
+
+def render_session_list(sessions: List[Any]) -> None:
+    """Render a compact session list as a single markdown delta
+
+    Each st.* call is a separate delta message to the frontend, so the
+    dashboard overview concatenates every card's (cached) header markup
+    and ships it in one st.markdown instead of several per session.
+    Interactive details stay on the per-session cards.
+    """
+    parts = []
+    for session in sessions:
+        duration_str = ""
+        if getattr(session, 'duration', None):
+            duration_str = f"{int(session.duration / 60):02d}:{int(session.duration % 60):02d}"
+
+        status = session.status.value if hasattr(session.status, 'value') else str(session.status)
+        updated_at = session.updated_at.isoformat() if getattr(session, 'updated_at', None) else ""
+
+        parts.append(_session_card_html(session.id, session.patient_name, session.doctor_name,
+                                        session.session_date, duration_str, status, updated_at))
+
+    st.markdown('<hr style="margin: 4px 0;">'.join(parts), unsafe_allow_html=True)
+
+
 def render_session_card(session: Any, show_audio: bool = True) -> bool:
     """
     Render a session card in the UI with enhanced details
-    
+
     Args:
         session: Session object
         show_audio: Whether to show enhanced details (now always shows in details)
-        
+
     Returns:
         True if session was selected (deprecated, handled internally now)
     """
     with st.container():
-        # Session header
-        col1, col2, col3 = st.columns([3, 2, 1])
-        
-        with col1:
-            st.markdown(f"**{session.patient_name}**")
-            st.markdown(f"Dr. {session.doctor_name}")
-        
-        with col2:
-            st.markdown(f"📅 {session.session_date}")
-            if hasattr(session, 'duration') and session.duration:
-                duration_str = f"{int(session.duration // 60):02d}:{int(session.duration % 60):02d}"
-                st.markdown(f"⏰ {duration_str}")
-        
-        with col3:
-            status = session.status.value if hasattr(session.status, 'value') else str(session.status)
-            status_colors = {
-                'completed': '🟢',
-                'processing': '🟡', 
-                'pending': '🔴',
-                'error': '❌'
-            }
-            st.markdown(f"{status_colors.get(status, '⚪')} {status.title()}")
-        
+        # Session header - markup is memoized per (id, updated_at, status)
+        # so unchanged sessions reuse the cached string across reruns
+        duration_str = ""
+        if getattr(session, 'duration', None):
+            duration_str = f"{int(session.duration // 60):02d}:{int(session.duration % 60):02d}"
+
+        status = session.status.value if hasattr(session.status, 'value') else str(session.status)
+        updated_at = session.updated_at.isoformat() if getattr(session, 'updated_at', None) else ""
+
+        st.markdown(
+            _session_card_html(session.id, session.patient_name, session.doctor_name,
+                               session.session_date, duration_str, status, updated_at),
+            unsafe_allow_html=True
+        )
+
         # Enhanced details section
-        unique_id = f"card_{session.id}_{int(time.time() * 1000)}"
-        render_enhanced_session_details(session, unique_id)
-        
+        render_enhanced_session_details(session)
+
         st.divider()
         return False  # Not needed anymore since we handle it internally
 
@@ -426,13 +507,8 @@ def render_audio_player(session_id: int, filename: str):
         
         audio_data = db_service.get_audio_data(session_id)
         if audio_data:
-            audio_base64 = encode_audio_for_html(audio_data, filename)
-            st.markdown(f"""
-                <audio controls style="width: 100%; margin: 5px 0;">
-                    <source src="{audio_base64}" type="audio/mpeg">
-                    Your browser does not support the audio element.
-                </audio>
-            """, unsafe_allow_html=True)
+            cached_path = ensure_audio_cached(session_id, audio_data, filename)
+            st.audio(str(cached_path))
         else:
             st.info("Audio not available")
     except Exception as e:
@@ -572,12 +648,12 @@ def render_filters() -> Dict[str, Any]:
         }
 
 
-def render_chat_message(message: Dict[str, Any], message_id: str):
-    """Render individual chat message with WhatsApp-style UI"""
+def _chat_message_html(message: Dict[str, Any]) -> str:
+    """Build the WhatsApp-style HTML for a single chat message"""
     is_doctor = message.get('is_doctor', False)
     text = message.get('text', '')
     timestamp = message.get('timestamp', '')
-    
+
     # Create alignment classes
     alignment = "margin-left: 20%; text-align: right;" if is_doctor else "margin-right: 20%; text-align: left;"
     bubble_color = "#DCF8C6" if is_doctor else "#FFFFFF"
@@ -616,5 +692,22 @@ def render_chat_message(message: Dict[str, Any], message_id: str):
         </div>
     </div>
     """
-    
-    st.markdown(chat_html, unsafe_allow_html=True) 
\ No newline at end of file
+
+    return chat_html
+
+
+def render_chat_messages(messages: List[Dict[str, Any]]) -> None:
+    """Render a list of chat messages as a single markdown call
+
+    Each st.markdown is a separate message to the browser, so batching
+    N bubbles into one call collapses N round-trips to 1.
+    """
+    if not messages:
+        return
+
+    st.markdown("".join(_chat_message_html(message) for message in messages), unsafe_allow_html=True)
+
+
+def render_chat_message(message: Dict[str, Any], message_id: str):
+    """Render individual chat message with WhatsApp-style UI"""
+    st.markdown(_chat_message_html(message), unsafe_allow_html=True)
\ No newline at end of file
@@ -3,19 +3,21 @@ Configuration module for MedTranscribe application
 """
 
 from .settings import (
-    Config, 
-    DevelopmentConfig, 
-    ProductionConfig, 
+    Config,
+    DevelopmentConfig,
+    ProductionConfig,
     TestingConfig,
     get_config,
-    current_config
+    current_config,
+    AUDIO_DIR
 )
 
 __all__ = [
     'Config',
-    'DevelopmentConfig', 
+    'DevelopmentConfig',
     'ProductionConfig',
     'TestingConfig',
     'get_config',
-    'current_config'
-] 
\ No newline at end of file
+    'current_config',
+    'AUDIO_DIR'
+]
\ No newline at end of file
@@ -69,6 +69,10 @@ class Config:
     TEMP_DIR = DATA_DIR / "temp"
     UPLOADS_DIR = DATA_DIR / "uploads"
     EXPORTS_DIR = DATA_DIR / "exports"
+
+    # Cached audio idle longer than this (seconds since last playback)
+    # is swept from AUDIO_DIR
+    AUDIO_CACHE_TTL_SECONDS = 24 * 60 * 60
     
     @classmethod
     def get_config(cls) -> Dict[str, Any]:
@@ -105,12 +109,12 @@ config_map = {
     'default': DevelopmentConfig
 }
 
+# Environment name read once at import - env vars don't change mid-process
+_ENV_NAME = os.getenv('FLASK_ENV', 'default')
+
 def get_config(config_name: str = None) -> Config:
     """Get configuration class based on environment"""
-    if config_name is None:
-        config_name = os.getenv('FLASK_ENV', 'default')
-    
-    return config_map.get(config_name, DevelopmentConfig)
+    return config_map.get(config_name or _ENV_NAME, DevelopmentConfig)
 
 # Current configuration instance
 current_config = get_config() 
\ No newline at end of file
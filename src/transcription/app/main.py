@@ -10,23 +10,23 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from app.config import current_config
 from app.utils import setup_logging, get_logger
+from app.services.database_service import db_service
+from app.pages.dashboard import render_dashboard
+from app.pages.transcription import render_transcription_page
 
 # Initialize logging
 setup_logging()
 logger = get_logger(__name__)
 
 
-def configure_streamlit():
-    """Configure Streamlit page settings"""
-    st.set_page_config(
-        page_title=current_config.PAGE_TITLE,
-        page_icon=current_config.PAGE_ICON,
-        layout=current_config.LAYOUT,
-        initial_sidebar_state=current_config.INITIAL_SIDEBAR_STATE
-    )
-    
-    # Custom CSS for medical theme
-    st.markdown("""
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_stats():
+    """Fetch database stats at most once per TTL window across reruns"""
+    return db_service.get_stats()
+
+
+# Custom CSS for medical theme (module-level so the string is built once)
+_CUSTOM_CSS = """
     <style>
     .main > div {
         padding-top: 2rem;
@@ -64,7 +64,22 @@ def configure_streamlit():
     footer {visibility: hidden;}
     .stDeployButton {display:none;}
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+
+def configure_streamlit():
+    """Configure Streamlit page settings"""
+    st.set_page_config(
+        page_title=current_config.PAGE_TITLE,
+        page_icon=current_config.PAGE_ICON,
+        layout=current_config.LAYOUT,
+        initial_sidebar_state=current_config.INITIAL_SIDEBAR_STATE
+    )
+
+    # Emit the prebuilt constant - Streamlit prunes elements that are not
+    # re-emitted on rerun, so the injection itself cannot be skipped, but
+    # the identical string lets the frontend diff it away cheaply
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
 
 def render_sidebar():
@@ -101,8 +116,7 @@ def render_sidebar():
         # System status
         st.markdown("### 📊 System Status")
         try:
-            from app.services.database_service import db_service
-            stats = db_service.get_stats()
+            stats = _cached_stats()
             st.metric("Total Sessions", stats.get('total_sessions', 0))
             st.metric("This Month", stats.get('this_month', 0))
             st.success("🟢 System Online")
@@ -123,15 +137,10 @@ def main():
         selected_page = render_sidebar()
         
         # Route to appropriate page
-        if selected_page == "Dashboard":
-            from app.pages.dashboard import render_dashboard
-            render_dashboard()
-        elif selected_page == "Transcription":
-            from app.pages.transcription import render_transcription_page
+        if selected_page == "Transcription":
             render_transcription_page()
         else:
             # Default to dashboard
-            from app.pages.dashboard import render_dashboard
             render_dashboard()
     
     except Exception as e:
@@ -7,8 +7,12 @@ from typing import Optional, List, Dict, Any
 from enum import Enum
 
 
-class SessionStatus(Enum):
-    """Session processing status"""
+class SessionStatus(str, Enum):
+    """Session processing status
+
+    str-mixin so hot paths can compare against plain strings without
+    going through the Enum .value descriptor.
+    """
     PENDING = "pending"
     PROCESSING = "processing"
     COMPLETED = "completed"
@@ -16,7 +20,7 @@ class SessionStatus(Enum):
     CANCELLED = "cancelled"
 
 
-class SpeakerType(Enum):
+class SpeakerType(str, Enum):
     """Speaker types in medical conversations"""
     DOCTOR = "doctor"
     PATIENT = "patient"
@@ -24,7 +28,7 @@ class SpeakerType(Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class AudioSegment:
     """Individual audio segment with speaker information"""
     id: Optional[int] = None
@@ -35,33 +39,39 @@ class AudioSegment:
     text: str = ""
     confidence: float = 0.0
     segment_order: int = 0
-    
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
-        """Convert string speaker_type to enum if needed"""
-        if isinstance(self.speaker_type, str):
-            self.speaker_type = SpeakerType(self.speaker_type.lower())
-    
+        """Verify the DB layer handed us a typed speaker_type
+
+        Enum conversion happens at deserialization time in
+        DatabaseService, so constructions here stay allocation-free.
+        """
+        assert isinstance(self.speaker_type, SpeakerType), self.speaker_type
+
     @property
     def duration(self) -> float:
         """Calculate segment duration"""
         return self.end_time - self.start_time
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return {
-            'id': self.id,
-            'transcription_id': self.transcription_id,
-            'speaker_type': self.speaker_type.value,
-            'start_time': self.start_time,
-            'end_time': self.end_time,
-            'text': self.text,
-            'confidence': self.confidence,
-            'segment_order': self.segment_order,
-            'duration': self.duration
-        }
+        """Convert to dictionary (cached after the first call)"""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'id': self.id,
+                'transcription_id': self.transcription_id,
+                'speaker_type': self.speaker_type.value,
+                'start_time': self.start_time,
+                'end_time': self.end_time,
+                'text': self.text,
+                'confidence': self.confidence,
+                'segment_order': self.segment_order,
+                'duration': self.duration
+            }
+        return self._dict_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionResult:
     """Transcription processing result"""
     id: Optional[int] = None
@@ -73,57 +83,87 @@ class TranscriptionResult:
     processing_time: float = 0.0
     created_at: Optional[datetime] = None
     segments: List[AudioSegment] = field(default_factory=list)
-    
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _segment_arrays: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _by_speaker: Optional[Dict[SpeakerType, List[AudioSegment]]] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Set created_at if not provided and convert string timestamps to datetime"""
         # Convert string timestamp to datetime object if needed
+        # (fromisoformat accepts 'Z' suffixes natively on Python 3.11+)
         if isinstance(self.created_at, str):
             try:
-                self.created_at = datetime.fromisoformat(self.created_at.replace('Z', '+00:00'))
+                self.created_at = datetime.fromisoformat(self.created_at)
             except (ValueError, AttributeError):
                 self.created_at = datetime.now()
         elif self.created_at is None:
             self.created_at = datetime.now()
     
+    def _get_segment_arrays(self) -> tuple:
+        """Lazily build parallel (start, end, confidence) numpy arrays
+
+        Cached on the instance so the interpreter loop over segments runs
+        once; stats are then vectorized over the arrays.
+        """
+        if self._segment_arrays is None:
+            import numpy as np
+
+            count = len(self.segments)
+            self._segment_arrays = (
+                np.fromiter((s.start_time for s in self.segments), dtype=np.float64, count=count),
+                np.fromiter((s.end_time for s in self.segments), dtype=np.float64, count=count),
+                np.fromiter((s.confidence for s in self.segments), dtype=np.float64, count=count)
+            )
+        return self._segment_arrays
+
     @property
     def average_confidence(self) -> float:
         """Calculate average confidence from segments"""
         if not self.segments:
             return self.confidence_score
-        
-        total_confidence = sum(segment.confidence for segment in self.segments)
-        return total_confidence / len(self.segments)
-    
+
+        _, _, confidence = self._get_segment_arrays()
+        return float(confidence.mean())
+
     @property
     def total_duration(self) -> float:
         """Calculate total duration from segments"""
         if not self.segments:
             return 0.0
-        
-        return sum(segment.duration for segment in self.segments)
+
+        start, end, _ = self._get_segment_arrays()
+        return float((end - start).sum())
     
     def get_segments_by_speaker(self, speaker_type: SpeakerType) -> List[AudioSegment]:
-        """Get segments filtered by speaker type"""
-        return [segment for segment in self.segments if segment.speaker_type == speaker_type]
+        """Get segments filtered by speaker type (indexed, built on first use)"""
+        if self._by_speaker is None:
+            by_speaker = {}
+            for segment in self.segments:
+                by_speaker.setdefault(segment.speaker_type, []).append(segment)
+            self._by_speaker = by_speaker
+        return self._by_speaker.get(speaker_type, [])
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
-        return {
-            'id': self.id,
-            'session_id': self.session_id,
-            'transcription_text': self.transcription_text,
-            'segments_json': self.segments_json,
-            'speaker_mapping': self.speaker_mapping,
-            'confidence_score': self.confidence_score,
-            'processing_time': self.processing_time,
-            'created_at': self.created_at.isoformat() if self.created_at and hasattr(self.created_at, 'isoformat') else str(self.created_at) if self.created_at else None,
-            'segments': [segment.to_dict() for segment in self.segments],
-            'average_confidence': self.average_confidence,
-            'total_duration': self.total_duration
-        }
+        """Convert to dictionary (cached after the first call)"""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                'id': self.id,
+                'session_id': self.session_id,
+                'transcription_text': self.transcription_text,
+                'segments_json': self.segments_json,
+                'speaker_mapping': self.speaker_mapping,
+                'confidence_score': self.confidence_score,
+                'processing_time': self.processing_time,
+                # __post_init__ guarantees created_at is a datetime or None
+                'created_at': self.created_at.isoformat() if self.created_at else None,
+                'segments': [segment.to_dict() for segment in self.segments],
+                'average_confidence': self.average_confidence,
+                'total_duration': self.total_duration
+            }
+        return self._dict_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Medical transcription session"""
     id: Optional[int] = None
@@ -140,7 +180,31 @@ class Session:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     transcription: Optional[TranscriptionResult] = None
-    
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_row(cls, row) -> 'Session':
+        """Build a Session from the standard 12-column query projection
+
+        Positional indexing matches the explicit SELECT lists in
+        DatabaseService and skips the per-field sqlite3.Row name lookups
+        that dominate Python-side cost when hydrating long listings.
+        """
+        return cls(
+            id=row[0],
+            patient_name=row[1],
+            doctor_name=row[2],
+            session_date=row[3],
+            audio_filename=row[4],
+            file_size=row[5],
+            duration=row[6],
+            session_notes=row[7],
+            model_used=row[8],
+            status=SessionStatus(row[9]),
+            created_at=row[10],
+            updated_at=row[11]
+        )
+
     def __post_init__(self):
         """Set timestamps if not provided and convert string timestamps to datetime"""
         now = datetime.now()
@@ -148,7 +212,7 @@ class Session:
         # Convert string timestamps to datetime objects if needed
         if isinstance(self.created_at, str):
             try:
-                self.created_at = datetime.fromisoformat(self.created_at.replace('Z', '+00:00'))
+                self.created_at = datetime.fromisoformat(self.created_at)
             except (ValueError, AttributeError):
                 self.created_at = now
         elif self.created_at is None:
@@ -156,15 +220,15 @@ class Session:
             
         if isinstance(self.updated_at, str):
             try:
-                self.updated_at = datetime.fromisoformat(self.updated_at.replace('Z', '+00:00'))
+                self.updated_at = datetime.fromisoformat(self.updated_at)
             except (ValueError, AttributeError):
                 self.updated_at = now
         elif self.updated_at is None:
             self.updated_at = now
         
-        # Convert string status to enum if needed
-        if isinstance(self.status, str):
-            self.status = SessionStatus(self.status.lower())
+        # Enum conversion lives in the DB deserialization layer; by the
+        # time a Session exists the status must already be typed
+        assert isinstance(self.status, SessionStatus), self.status
     
     @property
     def file_size_mb(self) -> float:
@@ -202,10 +266,37 @@ class Session:
         """Update session status with timestamp"""
         self.status = status
         self.updated_at = datetime.now()
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
+        self._dict_cache = None
+
+    def to_summary_dict(self) -> Dict[str, Any]:
+        """Convert to a lightweight dictionary without transcription data
+
+        List views only need header fields; skipping the transcription
+        (and its per-segment dicts) avoids allocation proportional to
+        segment count for every displayed session.
+        """
         return {
+            'id': self.id,
+            'patient_name': self.patient_name,
+            'doctor_name': self.doctor_name,
+            'session_date': self.session_date,
+            'audio_filename': self.audio_filename,
+            'file_size': self.file_size,
+            'file_size_mb': self.file_size_mb,
+            'duration': self.duration,
+            'duration_formatted': self.duration_formatted,
+            'model_used': self.model_used,
+            'status': self.status.value,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (cached until the session is mutated)"""
+        if self._dict_cache is not None:
+            return self._dict_cache
+
+        self._dict_cache = {
             'id': self.id,
             'patient_name': self.patient_name,
             'doctor_name': self.doctor_name,
@@ -218,16 +309,18 @@ class Session:
             'session_notes': self.session_notes,
             'model_used': self.model_used,
             'status': self.status.value,
-            'created_at': self.created_at.isoformat() if self.created_at and hasattr(self.created_at, 'isoformat') else str(self.created_at) if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at and hasattr(self.updated_at, 'isoformat') else str(self.updated_at) if self.updated_at else None,
+            # __post_init__ guarantees timestamps are datetime or None
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
             'transcription': self.transcription.to_dict() if self.transcription else None,
             'is_completed': self.is_completed,
             'is_processing': self.is_processing,
             'has_error': self.has_error
         }
+        return self._dict_cache
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionFilter:
     """Filter parameters for session queries"""
     doctor_name: Optional[str] = None
@@ -237,7 +330,23 @@ class SessionFilter:
     search_query: Optional[str] = None
     limit: int = 50
     offset: int = 0
-    
+
+    def cache_key(self) -> tuple:
+        """Frozen tuple of filter fields for use as a hashable cache key
+
+        The dataclass itself stays mutable, so caching layers (lru_cache,
+        st.cache_data hash_funcs) should key on this tuple instead.
+        """
+        return (
+            self.doctor_name,
+            self.patient_name,
+            self.status.value if self.status else None,
+            self.date_filter,
+            self.search_query,
+            self.limit,
+            self.offset
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
         return {
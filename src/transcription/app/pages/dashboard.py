@@ -6,19 +6,45 @@ from datetime import datetime
 from typing import Dict, Any
 
 from ..services.database_service import db_service
-from ..components import render_stats_cards, render_session_card
+from ..components import render_stats_cards, render_session_list
+from ..models import SessionFilter, SessionStatus
 from ..utils import get_logger
 
 logger = get_logger(__name__)
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_stats() -> Dict[str, Any]:
+    """Fetch database stats at most once per TTL window across reruns"""
+    return db_service.get_stats()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_status_counts(date_filter: str = None) -> Dict[str, int]:
+    """Fetch per-status session counts without hydrating Session objects"""
+    return db_service.get_status_counts(date_filter)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_sessions(status: str = None, date_filter: str = None,
+                     limit: int = 50, offset: int = 0):
+    """Fetch sessions via hashable primitives so reruns hit the cache"""
+    session_filter = SessionFilter(
+        status=SessionStatus(status) if status else None,
+        date_filter=date_filter,
+        limit=limit,
+        offset=offset
+    )
+    return db_service.get_sessions(session_filter)
+
+
 def render_dashboard():
     """Render the main dashboard page"""
     st.title("🏥 MedTranscribe Dashboard")
     
     try:
         # Get statistics
-        stats = db_service.get_stats()
+        stats = _cached_stats()
         
         # Render stats cards
         render_stats_cards(stats)
@@ -32,16 +58,12 @@ def render_dashboard():
             st.subheader("📋 Recent Sessions")
             
             # Get recent sessions (last 10)
-            from ..models import SessionFilter
-            recent_filter = SessionFilter(limit=10, offset=0)
-            recent_sessions = db_service.get_sessions(recent_filter)
+            recent_sessions = _cached_sessions(limit=10, offset=0)
             
             if recent_sessions:
-                for session in recent_sessions:
-                    session_dict = session.to_dict()
-                    if render_session_card(session_dict, show_audio=False):
-                        # Handle session selection
-                        st.switch_page("pages/transcription.py")
+                # Single markdown delta for the whole list instead of
+                # several widget writes per session
+                render_session_list(recent_sessions)
             else:
                 st.info("No sessions found. Upload your first audio file to get started!")
         
@@ -59,29 +81,22 @@ def render_dashboard():
 def render_quick_analytics():
     """Render quick analytics section"""
     try:
-        # Get additional statistics
-        from ..models import SessionFilter, SessionStatus
-        
-        # This week's sessions
-        this_week_filter = SessionFilter(date_filter="last_7_days", limit=100)
-        this_week_sessions = db_service.get_sessions(this_week_filter)
-        
-        # Completed vs pending
-        completed_filter = SessionFilter(status=SessionStatus.COMPLETED, limit=100)
-        completed_sessions = db_service.get_sessions(completed_filter)
-        
-        pending_filter = SessionFilter(status=SessionStatus.PENDING, limit=100)
-        pending_sessions = db_service.get_sessions(pending_filter)
-        
+        # One GROUP BY instead of hydrating hundreds of Session objects
+        status_counts = _cached_status_counts()
+        this_week_count = sum(_cached_status_counts("last_7_days").values())
+
+        completed_count = status_counts.get('completed', 0)
+        pending_count = status_counts.get('pending', 0)
+
         # Display metrics
-        st.metric("📅 This Week", len(this_week_sessions))
-        st.metric("✅ Completed", len(completed_sessions))
-        st.metric("⏳ Pending", len(pending_sessions))
-        
+        st.metric("📅 This Week", this_week_count)
+        st.metric("✅ Completed", completed_count)
+        st.metric("⏳ Pending", pending_count)
+
         # Processing status pie chart
-        if len(completed_sessions) > 0 or len(pending_sessions) > 0:
+        if completed_count > 0 or pending_count > 0:
             st.markdown("**Processing Status**")
-            completed_pct = len(completed_sessions) / (len(completed_sessions) + len(pending_sessions)) * 100
+            completed_pct = completed_count / (completed_count + pending_count) * 100
             st.progress(completed_pct / 100)
             st.caption(f"{completed_pct:.1f}% Completed")
     
@@ -90,30 +105,41 @@ def render_quick_analytics():
         st.error("Failed to load analytics data")
 
 
+# Status -> (widget, message template) dispatch for the activity feed
+_ACTIVITY_DISPATCH = {
+    "completed": (st.success, "✅ {time} - Completed transcription for {patient}"),
+    "processing": (st.info, "🔄 {time} - Processing audio for {patient}"),
+    "pending": (st.warning, "⏳ {time} - New session created for {patient}"),
+    "error": (st.error, "❌ {time} - Error processing {patient}"),
+}
+
+
+def _format_activity_time(activity_time: datetime) -> str:
+    """Format a feed timestamp as HH:MM without going through strftime
+
+    Plain f-string formatting skips strftime's format parsing and locale
+    lookup, which adds up when the feed renders on every rerun.
+    """
+    return f"{activity_time.hour:02d}:{activity_time.minute:02d}"
+
+
 def render_activity_feed():
     """Render recent activity feed"""
     st.subheader("🔔 Recent Activity")
-    
+
     try:
         # Get recent sessions with different statuses
-        from ..models import SessionFilter
-        
-        activity_filter = SessionFilter(limit=5)
-        recent_activity = db_service.get_sessions(activity_filter)
-        
+        recent_activity = _cached_sessions(limit=5)
+
         if recent_activity:
             for session in recent_activity:
                 activity_time = session.updated_at or session.created_at
-                time_str = activity_time.strftime("%H:%M") if activity_time else "Unknown"
+                time_str = _format_activity_time(activity_time) if activity_time else "Unknown"
                 
-                if session.status.value == "completed":
-                    st.success(f"✅ {time_str} - Completed transcription for {session.patient_name}")
-                elif session.status.value == "processing":
-                    st.info(f"🔄 {time_str} - Processing audio for {session.patient_name}")
-                elif session.status.value == "pending":
-                    st.warning(f"⏳ {time_str} - New session created for {session.patient_name}")
-                elif session.status.value == "error":
-                    st.error(f"❌ {time_str} - Error processing {session.patient_name}")
+                render_fn, template = _ACTIVITY_DISPATCH.get(
+                    session.status, (st.info, "{time} - {patient}")
+                )
+                render_fn(template.format(time=time_str, patient=session.patient_name))
         else:
             st.info("No recent activity")
     
@@ -3,14 +3,17 @@ Transcription page for audio upload and session management
 """
 import streamlit as st
 from datetime import datetime
+import os
+import tempfile
 import time
+from pathlib import Path
 from typing import Dict, Any
 
 from ..services.database_service import db_service
 from ..components import render_upload_form, render_session_card
 from ..utils import (
     get_logger, validate_session_data, parse_transcription_text,
-    create_text_export, create_download_filename
+    create_text_export, create_download_filename, spool_upload_to_file
 )
 from ..models import SessionFilter
 
@@ -60,47 +63,49 @@ def process_uploaded_audio(upload_data: Dict[str, Any]):
                 st.error(f"• {error}")
             return
         
-        # Get uploaded file
+        # Stream the upload to disk instead of reading it into memory
         uploaded_file = upload_data['uploaded_file']
-        audio_data = uploaded_file.read()
-        
+        with tempfile.NamedTemporaryFile(suffix=Path(uploaded_file.name).suffix, delete=False) as tmp:
+            # Uploads already spooled to disk copy kernel-to-kernel via
+            # sendfile; the helper loops over short writes and falls back
+            # to a userland copy for BytesIO-backed uploads
+            spool_upload_to_file(uploaded_file, tmp)
+            audio_path = tmp.name
+
         # Validate audio file
         from ..services.transcription_service import transcription_service
         audio_validation = transcription_service.validate_audio_file(
-            uploaded_file.name, len(audio_data)
+            uploaded_file.name, os.path.getsize(audio_path)
         )
-        
+
         if not audio_validation['valid']:
+            os.unlink(audio_path)
             st.error(audio_validation['error'])
             return
-        
-        # Show processing status
+
+        # Show processing status driven by real progress callbacks
         with st.container():
             st.info("🔄 Processing your audio file...")
             progress_bar = st.progress(0)
             status_text = st.empty()
-            
-            # Update progress
-            for i in range(100):
-                progress_bar.progress(i / 100)
-                if i < 20:
-                    status_text.text("Initializing transcription...")
-                elif i < 60:
-                    status_text.text("Processing audio segments...")
-                elif i < 90:
-                    status_text.text("Analyzing speaker patterns...")
-                else:
-                    status_text.text("Finalizing transcription...")
-                time.sleep(0.05)
-            
-            # Process the audio
-            result = transcription_service.process_audio_file(
-                audio_data=audio_data,
-                audio_filename=uploaded_file.name,
-                session_details=session_data,
-                model_size=upload_data['model_size']
-            )
-            
+
+            def update_progress(fraction: float, message: str):
+                progress_bar.progress(fraction)
+                status_text.text(message)
+
+            # Process the audio from the on-disk copy
+            try:
+                result = transcription_service.process_audio_file(
+                    audio_path=audio_path,
+                    audio_filename=uploaded_file.name,
+                    session_details=session_data,
+                    model_size=upload_data['model_size'],
+                    progress_cb=update_progress
+                )
+            finally:
+                if os.path.exists(audio_path):
+                    os.unlink(audio_path)
+
             progress_bar.progress(100)
             
             if result['success']:
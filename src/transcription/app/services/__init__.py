@@ -2,12 +2,16 @@
 Services module for MedTranscribe application
 """
 
-from .database_service import DatabaseService, db_service
+from .database_service import (
+    DatabaseService, AsyncDatabaseService, db_service, get_db_service
+)
 
 # Note: TranscriptionService imports are avoided here to prevent circular dependencies
 # Import transcription_service directly where needed
 
 __all__ = [
     'DatabaseService',
-    'db_service'
-] 
\ No newline at end of file
+    'AsyncDatabaseService',
+    'db_service',
+    'get_db_service'
+]
\ No newline at end of file
@@ -1,10 +1,14 @@
 """
 Database service for transcription management
 """
+import asyncio
+import os
+import platform
 import sqlite3
 import json
 import logging
-from typing import List, Optional, Dict, Any
+import threading
+from typing import Iterator, List, Optional, Dict, Any
 from pathlib import Path
 
 from ..models import (
@@ -16,114 +20,243 @@ from ..config import current_config
 logger = logging.getLogger(__name__)
 
 
+# RAM-backed scratch directory for temp data that outgrows
+# temp_store=MEMORY and has to spill to a file (Linux only); spilled
+# sort runs then never touch the disk
+_SHM_DIR = '/dev/shm' if platform.system() == 'Linux' and os.path.isdir('/dev/shm') else None
+
+# Bump when the DDL below changes so existing files re-run the script
+_SCHEMA_VERSION = 1
+
+# Full schema, applied in one transaction. Notes on the non-obvious bits:
+# - session_audio is a sidecar so multi-MB blobs stay out of the sessions
+#   b-tree (sessions.audio_data remains for rows written before it existed)
+# - sessions_fts is a trigram full-text index over the searchable
+#   name/notes columns, kept in sync by the triggers; the 'rebuild' step
+#   indexes rows that predate it and is a no-op on a fresh file
+# - idx_sessions_created_at turns ORDER BY created_at DESC LIMIT n into a
+#   backward index walk; the composite covers filter-by-doctor listings
+_SCHEMA_DDL = """
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    patient_name TEXT NOT NULL,
+    doctor_name TEXT NOT NULL,
+    session_date TEXT NOT NULL,
+    audio_filename TEXT NOT NULL,
+    audio_data BLOB,
+    file_size INTEGER,
+    duration REAL,
+    session_notes TEXT DEFAULT '',
+    model_used TEXT DEFAULT 'tiny',
+    status TEXT DEFAULT 'pending',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS session_audio (
+    session_id INTEGER PRIMARY KEY,
+    audio_data BLOB,
+    FOREIGN KEY (session_id) REFERENCES sessions (id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS transcriptions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id INTEGER NOT NULL,
+    transcription_text TEXT,
+    segments_json TEXT
+        CHECK (segments_json IS NULL OR segments_json = ''
+               OR json_valid(segments_json)),
+    speaker_mapping TEXT,
+    confidence_score REAL DEFAULT 0.0,
+    processing_time REAL DEFAULT 0.0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (session_id) REFERENCES sessions (id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS speakers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    transcription_id INTEGER NOT NULL,
+    speaker_type TEXT NOT NULL,
+    start_time REAL NOT NULL,
+    end_time REAL NOT NULL,
+    text TEXT NOT NULL,
+    confidence REAL DEFAULT 0.0,
+    segment_order INTEGER DEFAULT 0,
+    FOREIGN KEY (transcription_id) REFERENCES transcriptions (id) ON DELETE CASCADE
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS sessions_fts USING fts5(
+    patient_name, doctor_name, session_notes,
+    content='sessions', content_rowid='id',
+    tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS sessions_fts_ai AFTER INSERT ON sessions BEGIN
+    INSERT INTO sessions_fts(rowid, patient_name, doctor_name, session_notes)
+    VALUES (new.id, new.patient_name, new.doctor_name, new.session_notes);
+END;
+
+CREATE TRIGGER IF NOT EXISTS sessions_fts_ad AFTER DELETE ON sessions BEGIN
+    INSERT INTO sessions_fts(sessions_fts, rowid, patient_name, doctor_name, session_notes)
+    VALUES ('delete', old.id, old.patient_name, old.doctor_name, old.session_notes);
+END;
+
+CREATE TRIGGER IF NOT EXISTS sessions_fts_au AFTER UPDATE ON sessions BEGIN
+    INSERT INTO sessions_fts(sessions_fts, rowid, patient_name, doctor_name, session_notes)
+    VALUES ('delete', old.id, old.patient_name, old.doctor_name, old.session_notes);
+    INSERT INTO sessions_fts(rowid, patient_name, doctor_name, session_notes)
+    VALUES (new.id, new.patient_name, new.doctor_name, new.session_notes);
+END;
+
+INSERT INTO sessions_fts(sessions_fts) VALUES('rebuild');
+
+CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions(status);
+CREATE INDEX IF NOT EXISTS idx_sessions_date ON sessions(session_date);
+CREATE INDEX IF NOT EXISTS idx_sessions_doctor ON sessions(doctor_name);
+CREATE INDEX IF NOT EXISTS idx_sessions_patient ON sessions(patient_name);
+CREATE INDEX IF NOT EXISTS idx_transcriptions_session ON transcriptions(session_id);
+CREATE INDEX IF NOT EXISTS idx_speakers_transcription ON speakers(transcription_id);
+CREATE INDEX IF NOT EXISTS idx_sessions_created_at ON sessions(created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_sessions_doctor_created ON sessions(doctor_name, created_at DESC);
+
+ANALYZE;
+
+PRAGMA user_version = %d;
+
+COMMIT;
+""" % _SCHEMA_VERSION
+
+
 class DatabaseService:
     """Database service for managing transcription sessions"""
     
     def __init__(self, db_path: str = None):
         """Initialize database service"""
         self.db_path = db_path or current_config.DATABASE_URL
+        self._local = threading.local()
+        self._writes_since_optimize = 0
         self.init_database()
-        logger.info(f"Database service initialized with path: {self.db_path}")
-    
+        logger.info("Database service initialized with path: %s", self.db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use
+
+        Reusing one connection per thread avoids paying connect() plus
+        the PRAGMA round-trips on every call and keeps SQLite's page
+        cache warm across queries. The `with conn:` blocks below commit
+        or roll back at scope exit without closing the connection, so
+        callers use it exactly like a freshly opened one.
+
+        WAL lets readers proceed while a transcription is being written,
+        synchronous=NORMAL drops the per-commit fsync WAL makes safe to
+        skip, and the cache/temp/mmap settings keep query scratch space
+        out of the filesystem. busy_timeout retries instead of raising
+        SQLITE_BUSY immediately under write contention.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # isolation_level=None leaves transaction control to us:
+            # single-statement writes autocommit, and multi-statement
+            # writes open an explicit BEGIN IMMEDIATE
+            conn = sqlite3.connect(self.db_path, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            if _SHM_DIR:
+                conn.execute(f"PRAGMA temp_store_directory = '{_SHM_DIR}'")
+            conn.execute("PRAGMA cache_size=-20000")
+            conn.execute("PRAGMA mmap_size=134217728")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close this thread's connection, refreshing planner stats first
+
+        PRAGMA optimize re-analyzes only the tables whose statistics have
+        drifted, which the SQLite docs recommend running on long-lived
+        connections before they close.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error as e:
+                logger.error("Error optimizing database on close: %s", e)
+            conn.close()
+            self._local.conn = None
+
     def init_database(self):
-        """Initialize database tables"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Sessions table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS sessions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    patient_name TEXT NOT NULL,
-                    doctor_name TEXT NOT NULL,
-                    session_date TEXT NOT NULL,
-                    audio_filename TEXT NOT NULL,
-                    audio_data BLOB,
-                    file_size INTEGER,
-                    duration REAL,
-                    session_notes TEXT DEFAULT '',
-                    model_used TEXT DEFAULT 'tiny',
-                    status TEXT DEFAULT 'pending',
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Transcriptions table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS transcriptions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id INTEGER NOT NULL,
-                    transcription_text TEXT,
-                    segments_json TEXT,
-                    speaker_mapping TEXT,
-                    confidence_score REAL DEFAULT 0.0,
-                    processing_time REAL DEFAULT 0.0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (session_id) REFERENCES sessions (id) ON DELETE CASCADE
-                )
-            """)
-            
-            # Speakers table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS speakers (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    transcription_id INTEGER NOT NULL,
-                    speaker_type TEXT NOT NULL,
-                    start_time REAL NOT NULL,
-                    end_time REAL NOT NULL,
-                    text TEXT NOT NULL,
-                    confidence REAL DEFAULT 0.0,
-                    segment_order INTEGER DEFAULT 0,
-                    FOREIGN KEY (transcription_id) REFERENCES transcriptions (id) ON DELETE CASCADE
-                )
-            """)
-            
-            # Create indexes for better performance
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions(status)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_date ON sessions(session_date)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_doctor ON sessions(doctor_name)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_patient ON sessions(patient_name)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_transcriptions_session ON transcriptions(session_id)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_speakers_transcription ON speakers(transcription_id)")
-            
-            conn.commit()
+        """Initialize database tables
+
+        The whole schema ships as one executescript() batch gated by
+        PRAGMA user_version, so after the first run against a database
+        file, startup costs a single PRAGMA read instead of re-parsing
+        every CREATE ... IF NOT EXISTS statement.
+        """
+        with self._connect() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+                return
+
+            # Larger pages suit the audio BLOBs; only takes effect if the
+            # database file is being created by this call
+            conn.execute("PRAGMA page_size=32768")
+            conn.executescript(_SCHEMA_DDL)
             logger.info("Database tables initialized successfully")
-    
+
     def save_session(self, session: Session) -> int:
         """Save a new session to database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                
+
+                # Metadata and blob land in one transaction so a session
+                # row never exists without its audio
+                cursor.execute("BEGIN IMMEDIATE")
                 cursor.execute("""
                     INSERT INTO sessions (
                         patient_name, doctor_name, session_date, audio_filename,
-                        audio_data, file_size, duration, session_notes, model_used, status
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        file_size, duration, session_notes, model_used, status
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     session.patient_name, session.doctor_name, session.session_date,
-                    session.audio_filename, session.audio_data, session.file_size,
+                    session.audio_filename, session.file_size,
                     session.duration, session.session_notes, session.model_used,
                     session.status.value
                 ))
-                
+
                 session_id = cursor.lastrowid
+
+                if session.audio_data is not None:
+                    cursor.execute(
+                        "INSERT INTO session_audio (session_id, audio_data) VALUES (?, ?)",
+                        (session_id, session.audio_data)
+                    )
+
                 conn.commit()
                 
-                logger.info(f"Session saved successfully with ID: {session_id}")
+                logger.info("Session saved successfully with ID: %s", session_id)
                 return session_id
                 
         except Exception as e:
-            logger.error(f"Error saving session: {str(e)}")
+            logger.error("Error saving session: %s", e)
             raise
     
     def save_transcription(self, transcription: TranscriptionResult) -> int:
         """Save transcription results to database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                
+
+                # Take the write lock up front so the whole batch commits
+                # with a single fsync and a concurrent writer cannot turn
+                # a deferred read lock into SQLITE_BUSY mid-write
+                cursor.execute("BEGIN IMMEDIATE")
+
                 # Save main transcription
                 cursor.execute("""
                     INSERT INTO transcriptions (
@@ -138,18 +271,20 @@ class DatabaseService:
                 
                 transcription_id = cursor.lastrowid
                 
-                # Save individual speaker segments
-                for segment in transcription.segments:
-                    cursor.execute("""
-                        INSERT INTO speakers (
-                            transcription_id, speaker_type, start_time, end_time,
-                            text, confidence, segment_order
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        transcription_id, segment.speaker_type.value,
-                        segment.start_time, segment.end_time, segment.text,
-                        segment.confidence, segment.segment_order
-                    ))
+                # Save all speaker segments with one prepared statement -
+                # executemany parses the SQL once and binds each row in C,
+                # instead of re-parsing per segment
+                cursor.executemany("""
+                    INSERT INTO speakers (
+                        transcription_id, speaker_type, start_time, end_time,
+                        text, confidence, segment_order
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, [
+                    (transcription_id, segment.speaker_type.value,
+                     segment.start_time, segment.end_time, segment.text,
+                     segment.confidence, segment.segment_order)
+                    for segment in transcription.segments
+                ])
                 
                 # Update session status to completed
                 cursor.execute(
@@ -158,11 +293,19 @@ class DatabaseService:
                 )
                 
                 conn.commit()
-                logger.info(f"Transcription saved successfully with ID: {transcription_id}")
+
+                # Segment-heavy inserts shift table statistics; refresh
+                # them every so often so listing/search plans stay good
+                self._writes_since_optimize += 1
+                if self._writes_since_optimize >= 32:
+                    self._writes_since_optimize = 0
+                    conn.execute("PRAGMA optimize")
+
+                logger.info("Transcription saved successfully with ID: %s", transcription_id)
                 return transcription_id
                 
         except Exception as e:
-            logger.error(f"Error saving transcription: {str(e)}")
+            logger.error("Error saving transcription: %s", e)
             raise
     
     def get_sessions(self, filter_params: SessionFilter = None) -> List[Session]:
@@ -170,16 +313,22 @@ class DatabaseService:
         try:
             filter_params = filter_params or SessionFilter()
             
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                
+
+                # Explicit column list - never pull the audio_data BLOB into
+                # Python for listings where it is not displayed
+                # No speakers join: segment_count was never read, and the
+                # join materialized one row per segment only to collapse
+                # them again in the GROUP BY
                 query = """
-                    SELECT s.*, t.transcription_text, t.confidence_score,
-                           COUNT(sp.id) as segment_count
+                    SELECT s.id, s.patient_name, s.doctor_name, s.session_date,
+                           s.audio_filename, s.file_size, s.duration,
+                           s.session_notes, s.model_used, s.status,
+                           s.created_at, s.updated_at,
+                           t.transcription_text, t.confidence_score
                     FROM sessions s
                     LEFT JOIN transcriptions t ON s.id = t.session_id
-                    LEFT JOIN speakers sp ON t.id = sp.transcription_id
                     WHERE 1=1
                 """
                 params = []
@@ -200,57 +349,49 @@ class DatabaseService:
                 if filter_params.date_filter:
                     if isinstance(filter_params.date_filter, str):
                         if filter_params.date_filter == "last_7_days":
-                            query += " AND DATE(s.session_date) >= DATE('now', '-7 days')"
+                            query += " AND s.session_date >= DATE('now', '-7 days')"
                         elif filter_params.date_filter == "last_30_days":
-                            query += " AND DATE(s.session_date) >= DATE('now', '-30 days')"
+                            query += " AND s.session_date >= DATE('now', '-30 days')"
                     else:
-                        query += " AND DATE(s.session_date) = ?"
+                        query += " AND s.session_date = ?"
                         params.append(str(filter_params.date_filter))
                 
                 query += """
-                    GROUP BY s.id, t.id
                     ORDER BY s.created_at DESC
                     LIMIT ? OFFSET ?
                 """
                 params.extend([filter_params.limit, filter_params.offset])
                 
+                cursor.arraysize = 256
                 cursor.execute(query, params)
-                rows = cursor.fetchall()
-                
+
+                # Hydrate in fetchmany batches so peak memory tracks the
+                # batch, not the full result, when limits are large
                 sessions = []
-                for row in rows:
-                    session = Session(
-                        id=row['id'],
-                        patient_name=row['patient_name'],
-                        doctor_name=row['doctor_name'],
-                        session_date=row['session_date'],
-                        audio_filename=row['audio_filename'],
-                        file_size=row['file_size'],
-                        duration=row['duration'],
-                        session_notes=row['session_notes'],
-                        model_used=row['model_used'],
-                        status=SessionStatus(row['status']),
-                        created_at=row['created_at'],
-                        updated_at=row['updated_at']
-                    )
-                    sessions.append(session)
-                
-                logger.info(f"Retrieved {len(sessions)} sessions")
+                while batch := cursor.fetchmany():
+                    sessions.extend(Session.from_row(row) for row in batch)
+
+                logger.debug("Retrieved %d sessions", len(sessions))
                 return sessions
                 
         except Exception as e:
-            logger.error(f"Error retrieving sessions: {str(e)}")
+            logger.error("Error retrieving sessions: %s", e)
             raise
     
     def get_session_by_id(self, session_id: int) -> Optional[Session]:
         """Get complete session data by ID"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                
+
+                # Explicit columns - the audio BLOB is served separately
+                # by get_audio_data/iter_audio_data
                 cursor.execute("""
-                    SELECT s.*, t.transcription_text, t.segments_json, t.speaker_mapping,
+                    SELECT s.id, s.patient_name, s.doctor_name, s.session_date,
+                           s.audio_filename, s.file_size, s.duration,
+                           s.session_notes, s.model_used, s.status,
+                           s.created_at, s.updated_at,
+                           t.transcription_text, t.segments_json, t.speaker_mapping,
                            t.confidence_score, t.processing_time
                     FROM sessions s
                     LEFT JOIN transcriptions t ON s.id = t.session_id
@@ -261,158 +402,197 @@ class DatabaseService:
                 if not row:
                     return None
                 
-                session = Session(
-                    id=row['id'],
-                    patient_name=row['patient_name'],
-                    doctor_name=row['doctor_name'],
-                    session_date=row['session_date'],
-                    audio_filename=row['audio_filename'],
-                    file_size=row['file_size'],
-                    duration=row['duration'],
-                    session_notes=row['session_notes'],
-                    model_used=row['model_used'],
-                    status=SessionStatus(row['status']),
-                    created_at=row['created_at'],
-                    updated_at=row['updated_at']
-                )
-                
-                # Add transcription if available
-                if row['transcription_text']:
+                session = Session.from_row(row)
+
+                # Add transcription if available (columns 12+ follow the
+                # from_row projection)
+                if row[12]:
                     transcription = TranscriptionResult(
                         session_id=session_id,
-                        transcription_text=row['transcription_text'],
-                        segments_json=row['segments_json'],
-                        speaker_mapping=row['speaker_mapping'],
-                        confidence_score=row['confidence_score'],
-                        processing_time=row['processing_time']
+                        transcription_text=row[12],
+                        segments_json=row[13],
+                        speaker_mapping=row[14],
+                        confidence_score=row[15],
+                        processing_time=row[16]
                     )
                     session.transcription = transcription
                 
-                logger.info(f"Retrieved session {session_id}")
+                logger.debug("Retrieved session %s", session_id)
                 return session
                 
         except Exception as e:
-            logger.error(f"Error retrieving session {session_id}: {str(e)}")
+            logger.error("Error retrieving session %s: %s", session_id, e)
             raise
     
+    def iter_audio_data(self, session_id: int, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Stream audio data in chunks via incremental BLOB I/O
+
+        blobopen() reads the column without materializing the whole file,
+        so peak memory stays at chunk_size regardless of audio length.
+        `id` is the rowid (INTEGER PRIMARY KEY), which is what blobopen
+        keys on. Yields nothing if the session or its audio is missing.
+        """
+        try:
+            conn = self._connect()
+            try:
+                blob = conn.blobopen("session_audio", "audio_data", session_id, readonly=True)
+            except sqlite3.OperationalError:
+                # Rows written before the sidecar table keep the blob inline
+                blob = conn.blobopen("sessions", "audio_data", session_id, readonly=True)
+            with blob:
+                while chunk := blob.read(chunk_size):
+                    yield chunk
+        except sqlite3.Error as e:
+            logger.error("Error streaming audio data for session %s: %s", session_id, e)
+
     def get_audio_data(self, session_id: int) -> Optional[bytes]:
-        """Get audio file data for playback"""
+        """Get audio file data for playback as a single bytes object
+
+        Prefer iter_audio_data() when the caller can consume chunks.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT audio_data FROM sessions WHERE id = ?", (session_id,))
+                cursor.execute("SELECT audio_data FROM session_audio WHERE session_id = ?", (session_id,))
                 result = cursor.fetchone()
+                if result is None:
+                    # Rows written before the sidecar table keep the blob inline
+                    cursor.execute("SELECT audio_data FROM sessions WHERE id = ?", (session_id,))
+                    result = cursor.fetchone()
                 return result[0] if result else None
         except Exception as e:
-            logger.error(f"Error retrieving audio data for session {session_id}: {str(e)}")
+            logger.error("Error retrieving audio data for session %s: %s", session_id, e)
             return None
     
     def get_transcription_by_session_id(self, session_id: int) -> Optional['TranscriptionResult']:
         """Get transcription result by session ID"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                
+
+                # One join instead of transcription + segments round-trips;
+                # the transcription columns repeat on every row but are only
+                # read from the first
                 cursor.execute("""
-                    SELECT * FROM transcriptions WHERE session_id = ?
+                    SELECT t.transcription_text, t.segments_json, t.speaker_mapping,
+                           t.confidence_score, t.processing_time,
+                           sp.speaker_type, sp.start_time, sp.end_time,
+                           sp.text, sp.confidence, sp.segment_order
+                    FROM transcriptions t
+                    LEFT JOIN speakers sp ON sp.transcription_id = t.id
+                    WHERE t.session_id = ?
+                    ORDER BY sp.segment_order
                 """, (session_id,))
-                
-                row = cursor.fetchone()
-                if not row:
+
+                rows = cursor.fetchall()
+                if not rows:
                     return None
-                
-                # Import here to avoid circular imports
-                from ..models.session import TranscriptionResult, AudioSegment, SpeakerType
-                
-                # Get segments
-                cursor.execute("""
-                    SELECT * FROM speakers WHERE transcription_id = ? ORDER BY segment_order
-                """, (row['id'],))
-                
-                segment_rows = cursor.fetchall()
+
                 segments = []
-                
-                for seg_row in segment_rows:
-                    segment = AudioSegment(
-                        speaker_type=SpeakerType(seg_row['speaker_type']),
-                        start_time=seg_row['start_time'],
-                        end_time=seg_row['end_time'],
-                        text=seg_row['text'],
-                        confidence=seg_row['confidence'],
-                        segment_order=seg_row['segment_order']
-                    )
-                    segments.append(segment)
-                
+                if rows[0][5] is not None:  # LEFT JOIN found speaker rows
+                    segments = [
+                        AudioSegment(
+                            speaker_type=SpeakerType(row[5]),
+                            start_time=row[6],
+                            end_time=row[7],
+                            text=row[8],
+                            confidence=row[9],
+                            segment_order=row[10]
+                        )
+                        for row in rows
+                    ]
+
+                first = rows[0]
                 transcription = TranscriptionResult(
                     session_id=session_id,
-                    transcription_text=row['transcription_text'],
+                    transcription_text=first[0],
                     segments=segments,
-                    segments_json=row['segments_json'],
-                    speaker_mapping=row['speaker_mapping'],
-                    confidence_score=row['confidence_score'],
-                    processing_time=row['processing_time']
+                    segments_json=first[1],
+                    speaker_mapping=first[2],
+                    confidence_score=first[3],
+                    processing_time=first[4]
                 )
-                
-                logger.info(f"Retrieved transcription for session {session_id}")
+
+                logger.debug("Retrieved transcription for session %s", session_id)
                 return transcription
                 
         except Exception as e:
-            logger.error(f"Error retrieving transcription for session {session_id}: {str(e)}")
+            logger.error("Error retrieving transcription for session %s: %s", session_id, e)
             return None
     
     def update_session_status(self, session_id: int, status: SessionStatus):
         """Update session processing status"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
                     UPDATE sessions SET status = ?, updated_at = CURRENT_TIMESTAMP 
                     WHERE id = ?
                 """, (status.value, session_id))
                 conn.commit()
-                logger.info(f"Updated session {session_id} status to {status.value}")
+                logger.debug("Updated session %s status to %s", session_id, status.value)
         except Exception as e:
-            logger.error(f"Error updating session {session_id} status: {str(e)}")
+            logger.error("Error updating session %s status: %s", session_id, e)
             raise
     
     def delete_session(self, session_id: int):
         """Delete session and all related data"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
                 conn.commit()
-                logger.info(f"Deleted session {session_id}")
+                logger.info("Deleted session %s", session_id)
         except Exception as e:
-            logger.error(f"Error deleting session {session_id}: {str(e)}")
+            logger.error("Error deleting session %s: %s", session_id, e)
             raise
     
+    def get_status_counts(self, date_filter: str = None) -> Dict[str, int]:
+        """Get session counts grouped by status in a single query"""
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+
+                query = "SELECT status, COUNT(*) FROM sessions"
+                if date_filter == "last_7_days":
+                    query += " WHERE session_date >= DATE('now', '-7 days')"
+                elif date_filter == "last_30_days":
+                    query += " WHERE session_date >= DATE('now', '-30 days')"
+                query += " GROUP BY status"
+
+                cursor.execute(query)
+                return {row[0]: row[1] for row in cursor.fetchall()}
+
+        except Exception as e:
+            logger.error("Error retrieving status counts: %s", e)
+            return {}
+
+    def get_session_count(self, date_filter: str = None) -> int:
+        """Get total session count with optional date filtering"""
+        return sum(self.get_status_counts(date_filter).values())
+
     def get_stats(self) -> Dict[str, Any]:
         """Get database statistics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                
-                # Total sessions
-                cursor.execute("SELECT COUNT(*) FROM sessions")
-                total_sessions = cursor.fetchone()[0]
-                
-                # This month sessions
+
+                # All four aggregates in one round-trip. The month filter
+                # is a range predicate (rather than strftime per row) so
+                # idx_sessions_created_at can serve it.
                 cursor.execute("""
-                    SELECT COUNT(*) FROM sessions 
-                    WHERE strftime('%Y-%m', created_at) = strftime('%Y-%m', 'now')
+                    SELECT
+                        (SELECT COUNT(*) FROM sessions),
+                        (SELECT COUNT(*) FROM sessions
+                         WHERE created_at >= date('now', 'start of month')
+                           AND created_at < date('now', 'start of month', '+1 month')),
+                        (SELECT AVG(confidence_score) FROM transcriptions),
+                        (SELECT SUM(duration) FROM sessions WHERE duration IS NOT NULL)
                 """)
-                this_month = cursor.fetchone()[0]
-                
-                # Average confidence
-                cursor.execute("SELECT AVG(confidence_score) FROM transcriptions")
-                avg_confidence = cursor.fetchone()[0] or 0.0
-                
-                # Total duration
-                cursor.execute("SELECT SUM(duration) FROM sessions WHERE duration IS NOT NULL")
-                total_duration = cursor.fetchone()[0] or 0.0
-                
+                total_sessions, this_month, avg_confidence, total_duration = cursor.fetchone()
+                avg_confidence = avg_confidence or 0.0
+                total_duration = total_duration or 0.0
+
                 stats = {
                     'total_sessions': total_sessions,
                     'this_month': this_month,
@@ -420,91 +600,171 @@ class DatabaseService:
                     'total_duration_hours': round(total_duration / 3600, 1)
                 }
                 
-                logger.info("Retrieved database statistics")
+                logger.debug("Retrieved database statistics")
                 return stats
                 
         except Exception as e:
-            logger.error(f"Error retrieving stats: {str(e)}")
+            logger.error("Error retrieving stats: %s", e)
             raise
     
+    def get_dashboard_bundle(self, limit: int = 10) -> Dict[str, Any]:
+        """Fetch stats and the recent-session list in one call
+
+        Both reads run back to back on the same warm thread-local
+        connection, so a page render costs one bundle instead of separate
+        stats queries from the sidebar and each view.
+        """
+        return {
+            'stats': self.get_stats(),
+            'recent': self.get_sessions(SessionFilter(limit=limit))
+        }
+
     def search_sessions(self, search_query: str, date_filter=None) -> List[Session]:
         """Search sessions by patient name, doctor name, or notes"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                
-                query = """
-                    SELECT s.*, t.transcription_text
-                    FROM sessions s
-                    LEFT JOIN transcriptions t ON s.id = t.session_id
-                    WHERE (s.patient_name LIKE ? OR s.doctor_name LIKE ? OR s.session_notes LIKE ?)
-                """
-                params = [f"%{search_query}%", f"%{search_query}%", f"%{search_query}%"]
-                
+
+                if len(search_query) >= 3:
+                    # Trigram FTS: infix match via the inverted index.
+                    # Quoting makes the user text a literal string rather
+                    # than FTS5 query syntax.
+                    query = """
+                        SELECT s.id, s.patient_name, s.doctor_name, s.session_date,
+                               s.audio_filename, s.file_size, s.duration,
+                               s.session_notes, s.model_used, s.status,
+                               s.created_at, s.updated_at,
+                               t.transcription_text
+                        FROM sessions_fts f
+                        JOIN sessions s ON s.id = f.rowid
+                        LEFT JOIN transcriptions t ON s.id = t.session_id
+                        WHERE sessions_fts MATCH ?
+                    """
+                    params = ['"' + search_query.replace('"', '""') + '"']
+                else:
+                    # Trigram tokens need at least 3 characters; short
+                    # queries keep the LIKE scan
+                    query = """
+                        SELECT s.id, s.patient_name, s.doctor_name, s.session_date,
+                               s.audio_filename, s.file_size, s.duration,
+                               s.session_notes, s.model_used, s.status,
+                               s.created_at, s.updated_at,
+                               t.transcription_text
+                        FROM sessions s
+                        LEFT JOIN transcriptions t ON s.id = t.session_id
+                        WHERE (s.patient_name LIKE ? OR s.doctor_name LIKE ? OR s.session_notes LIKE ?)
+                    """
+                    params = [f"%{search_query}%", f"%{search_query}%", f"%{search_query}%"]
+
                 # Add date filtering
                 if date_filter:
                     if isinstance(date_filter, str):
                         if date_filter == "last_7_days":
-                            query += " AND DATE(s.session_date) >= DATE('now', '-7 days')"
+                            query += " AND s.session_date >= DATE('now', '-7 days')"
                         elif date_filter == "last_30_days":
-                            query += " AND DATE(s.session_date) >= DATE('now', '-30 days')"
+                            query += " AND s.session_date >= DATE('now', '-30 days')"
                     else:
-                        query += " AND DATE(s.session_date) = ?"
+                        query += " AND s.session_date = ?"
                         params.append(str(date_filter))
                 
                 query += " ORDER BY s.created_at DESC LIMIT 20"
                 
+                cursor.arraysize = 256
                 cursor.execute(query, params)
-                rows = cursor.fetchall()
-                
+
                 sessions = []
-                for row in rows:
-                    session = Session(
-                        id=row['id'],
-                        patient_name=row['patient_name'],
-                        doctor_name=row['doctor_name'],
-                        session_date=row['session_date'],
-                        audio_filename=row['audio_filename'],
-                        file_size=row['file_size'],
-                        duration=row['duration'],
-                        session_notes=row['session_notes'],
-                        model_used=row['model_used'],
-                        status=SessionStatus(row['status']),
-                        created_at=row['created_at'],
-                        updated_at=row['updated_at']
-                    )
-                    sessions.append(session)
-                
-                logger.info(f"Search found {len(sessions)} sessions for query: {search_query}")
+                while batch := cursor.fetchmany():
+                    sessions.extend(Session.from_row(row) for row in batch)
+
+                logger.debug("Search found %d sessions for query: %s", len(sessions), search_query)
                 return sessions
                 
         except Exception as e:
-            logger.error(f"Error searching sessions: {str(e)}")
+            logger.error("Error searching sessions: %s", e)
             raise
     
+    def _get_distinct_names(self, column: str) -> List[str]:
+        """Loose index scan over the unique values of an indexed column
+
+        The recursive CTE seeks to each successive distinct value via the
+        column's index - O(unique log N) seeks instead of the O(N)
+        scan-and-sort a DISTINCT performs. `column` is interpolated and
+        must be one of our own column names, never user input.
+        """
+        query = f"""
+            WITH RECURSIVE names(name) AS (
+                SELECT MIN({column}) FROM sessions
+                UNION ALL
+                SELECT (SELECT MIN({column}) FROM sessions WHERE {column} > names.name)
+                FROM names WHERE names.name IS NOT NULL
+            )
+            SELECT name FROM names WHERE name IS NOT NULL
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query)
+            return [row[0] for row in cursor.fetchall()]
+
     def get_doctors(self) -> List[str]:
         """Get list of unique doctor names"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT DISTINCT doctor_name FROM sessions ORDER BY doctor_name")
-                return [row[0] for row in cursor.fetchall()]
+            return self._get_distinct_names("doctor_name")
         except Exception as e:
-            logger.error(f"Error retrieving doctors: {str(e)}")
+            logger.error("Error retrieving doctors: %s", e)
             return []
-    
+
     def get_patients(self) -> List[str]:
         """Get list of unique patient names"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT DISTINCT patient_name FROM sessions ORDER BY patient_name")
-                return [row[0] for row in cursor.fetchall()]
+            return self._get_distinct_names("patient_name")
         except Exception as e:
-            logger.error(f"Error retrieving patients: {str(e)}")
+            logger.error("Error retrieving patients: %s", e)
             return []
 
 
+class AsyncDatabaseService:
+    """Asyncio façade that runs DatabaseService calls off the event loop
+
+    Streamlit drives the sync service directly, but async hosts (FastAPI,
+    background workers) must not block their loop on SQLite I/O. Every
+    attribute lookup returns a coroutine wrapper that executes the sync
+    method on the default thread pool; _connect()'s thread-local
+    connections make that safe, and WAL plus busy_timeout already
+    serialize concurrent writers.
+    """
+
+    def __init__(self, sync_service: DatabaseService = None):
+        self._sync = sync_service or DatabaseService()
+
+    def __getattr__(self, name):
+        method = getattr(self._sync, name)
+        if not callable(method):
+            return method
+
+        async def runner(*args, **kwargs):
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+        return runner
+
+
+try:
+    # Under Streamlit, st.cache_resource gives official process-wide
+    # singleton semantics shared across browser sessions
+    import streamlit as _st
+
+    @_st.cache_resource(show_spinner=False)
+    def get_db_service() -> DatabaseService:
+        """Get the shared DatabaseService instance"""
+        return DatabaseService()
+
+except ImportError:
+    from functools import lru_cache
+
+    @lru_cache(maxsize=None)
+    def get_db_service() -> DatabaseService:
+        """Get the shared DatabaseService instance"""
+        return DatabaseService()
+
+
 # Global database service instance
-db_service = DatabaseService() 
\ No newline at end of file
+db_service = get_db_service() 
\ No newline at end of file
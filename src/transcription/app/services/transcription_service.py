@@ -4,7 +4,11 @@ Transcription service for audio processing
 import logging
 import tempfile
 import os
-from typing import Dict, Any, Tuple, List, Optional
+import threading
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Any, Tuple, List, Optional
 from pathlib import Path
 
 from ..models import Session, TranscriptionResult, AudioSegment, SessionStatus, SpeakerType
@@ -17,8 +21,13 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 # We'll use lazy import to avoid circular imports
+@lru_cache(maxsize=1)
 def get_contextual_transcriber():
-    """Lazy import of ContextualTranscriber to avoid circular imports"""
+    """Lazy import of ContextualTranscriber to avoid circular imports
+
+    Cached so the spec_from_file_location/exec_module work (which
+    re-executes the whole module) runs once per process.
+    """
     try:
         # Try importing from main module first (where ContextualTranscriber actually exists)
         import importlib.util
@@ -47,6 +56,11 @@ def get_contextual_transcriber():
 
 logger = logging.getLogger(__name__)
 
+# Spill uploads to tmpfs when the platform has one: the file is read back
+# within the same request, so routing it through the disk writeback path
+# buys nothing but syscall stalls
+_TMP_SPILL_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
 
 class TranscriptionService:
     """Service for handling audio transcription and processing"""
@@ -54,61 +68,146 @@ class TranscriptionService:
     def __init__(self):
         """Initialize transcription service"""
         self.db_service = db_service
+        # Transcriber instances keyed by model size - model weights stay
+        # resident across requests instead of reloading per audio file
+        self._transcriber_cache: Dict[str, Any] = {}
+        # Overlaps the session BLOB insert with model loading; SQLite
+        # releases the GIL inside its C core so the write really runs in
+        # parallel
+        self._db_pool = ThreadPoolExecutor(max_workers=2)
+        self._warm_lock = threading.Lock()
+        # One lock per model size: cached transcribers carry their target
+        # path as instance state, so the set-path-and-transcribe section
+        # must be exclusive per instance (Streamlit serves each browser
+        # session from its own thread)
+        self._transcriber_locks: Dict[str, threading.Lock] = {}
         logger.info("Transcription service initialized")
+
+    def _transcriber_lock(self, model_size: str) -> threading.Lock:
+        """Return the lock guarding the cached transcriber for model_size"""
+        with self._warm_lock:
+            lock = self._transcriber_locks.get(model_size)
+            if lock is None:
+                lock = self._transcriber_locks[model_size] = threading.Lock()
+            return lock
+
+    def warm_model(self, model_size: str = "base") -> None:
+        """Load the transcriber for model_size ahead of the first request
+
+        Idempotent and safe to call from a background thread at startup,
+        so the first upload doesn't pay the multi-second model load.
+        """
+        with self._transcriber_lock(model_size):
+            if model_size in self._transcriber_cache:
+                return
+            try:
+                ContextualTranscriber = get_contextual_transcriber()
+                self._transcriber_cache[model_size] = ContextualTranscriber(model_size=model_size)
+                logger.info("Pre-warmed transcriber for model size %s", model_size)
+            except Exception as e:
+                logger.warning("Model pre-warm failed: %s", e)
     
-    def process_audio_file(self, audio_data: bytes, audio_filename: str, 
-                          session_details: Dict[str, Any], 
-                          model_size: str = "tiny") -> Dict[str, Any]:
+    def process_audio_file(self, audio_data: bytes = None, audio_filename: str = "",
+                          session_details: Dict[str, Any] = None,
+                          model_size: str = "tiny",
+                          progress_cb: Optional[Callable[[float, str], None]] = None,
+                          audio_path: str = None) -> Dict[str, Any]:
         """
         Process uploaded audio file and return transcription results
-        
+
         Args:
-            audio_data: Raw audio file data
+            audio_data: Raw audio file data (optional if audio_path is given)
             audio_filename: Original filename
             session_details: Session metadata
             model_size: Whisper model size to use
-            
+            progress_cb: Optional callback invoked with (fraction, message)
+                at each processing stage
+            audio_path: Path to audio already streamed to disk - preferred for
+                large uploads so the file is never held fully in memory here
+
         Returns:
             Dictionary with session data and processing results
         """
         session_id = None
+        save_future = None
         temp_path = None
-        
+        owns_temp = False
+
+        def report_progress(fraction: float, message: str):
+            if progress_cb:
+                progress_cb(fraction, message)
+
         try:
+            report_progress(0.05, "Initializing transcription...")
+
+            if audio_path:
+                file_size = os.path.getsize(audio_path)
+                # Read once for BLOB storage; released after the session save
+                session_audio = Path(audio_path).read_bytes()
+            else:
+                file_size = len(audio_data)
+                session_audio = audio_data
+
             # Create session object
             session = Session(
                 patient_name=session_details['patient_name'],
                 doctor_name=session_details['doctor_name'],
                 session_date=session_details['session_date'],
                 audio_filename=audio_filename,
-                audio_data=audio_data,
-                file_size=len(audio_data),
+                audio_data=session_audio,
+                file_size=file_size,
                 session_notes=session_details.get('session_notes', ''),
                 model_used=model_size,
-                status=SessionStatus.PENDING
+                # Insert directly as processing - a separate
+                # pending->processing UPDATE is one more write round trip
+                status=SessionStatus.PROCESSING
             )
-            
-            # Save session to database
-            session_id = self.db_service.save_session(session)
-            session.id = session_id
-            
-            logger.info(f"Created session {session_id} for patient {session.patient_name}")
-            
-            # Update status to processing
-            self.db_service.update_session_status(session_id, SessionStatus.PROCESSING)
-            
-            # Save audio to temporary file for processing
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as tmp_file:
-                tmp_file.write(audio_data)
-                temp_path = tmp_file.name
-            
-            logger.info(f"Processing audio file for session {session_id}")
-            
-            # Initialize transcriber and process
-            ContextualTranscriber = get_contextual_transcriber()
-            transcriber = ContextualTranscriber(model_size=model_size, audio_file=temp_path)
-            chat_content, segments = transcriber.transcribe_with_context(session_id=session_id)
-            
+
+            # Kick off the session save in the background - the multi-MB
+            # BLOB insert overlaps the temp-file spill and model load below
+            save_future = self._db_pool.submit(self.db_service.save_session, session)
+            del session_audio
+
+            if audio_path:
+                temp_path = audio_path
+            else:
+                # Save audio to temporary file for processing
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3",
+                                                 dir=_TMP_SPILL_DIR) as tmp_file:
+                    tmp_file.write(audio_data)
+                    temp_path = tmp_file.name
+                owns_temp = True
+
+            report_progress(0.2, "Loading AI model...")
+
+            # Reuse a warm transcriber when one exists for this model
+            # size; only the target file changes between requests. The
+            # lock spans path swap and transcription: a concurrent upload
+            # retargeting the shared instance mid-run would attribute one
+            # patient's audio to another session
+            with self._transcriber_lock(model_size):
+                transcriber = self._transcriber_cache.get(model_size)
+                if transcriber is None:
+                    ContextualTranscriber = get_contextual_transcriber()
+                    transcriber = ContextualTranscriber(model_size=model_size, audio_file=temp_path)
+                    self._transcriber_cache[model_size] = transcriber
+                else:
+                    transcriber.audio_file = transcriber._resolve_audio_path(temp_path)
+
+                # Join the background save; the id is needed from here on
+                session_id = save_future.result()
+                session.id = session_id
+                # Drop blob references so the audio isn't held in memory
+                # during transcription
+                session.audio_data = None
+
+                logger.info("Created session %s for patient %s", session_id, session.patient_name)
+                logger.info("Processing audio file for session %s", session_id)
+                report_progress(0.4, "Processing audio segments...")
+                chat_content, segments = transcriber.transcribe_with_context(session_id=session_id)
+
+            report_progress(0.85, "Finalizing transcription...")
+
             # Create transcription result object
             transcription = TranscriptionResult(
                 session_id=session_id,
@@ -120,24 +219,37 @@ class TranscriptionService:
                 segments=self._convert_segments(segments)
             )
             
-            # Save transcription to database
+            # Save transcription to database (also marks the session
+            # completed in the same transaction)
             transcription_id = self.db_service.save_transcription(transcription)
-            
-            # Get complete session data
-            complete_session = self.db_service.get_session_by_id(session_id)
-            
-            logger.info(f"Successfully processed session {session_id}")
-            
+
+            # Everything the caller needs is already in memory - skip the
+            # re-read of the row (and its audio-free joins) we just wrote
+            session.transcription = transcription
+            session.update_status(SessionStatus.COMPLETED)
+
+            logger.info("Successfully processed session %s", session_id)
+            report_progress(1.0, "Transcription complete")
+
             return {
                 'success': True,
-                'session': complete_session.to_dict() if complete_session else None,
+                'session': session.to_dict(),
                 'transcription_id': transcription_id,
                 'message': 'Transcription completed successfully'
             }
             
         except Exception as e:
-            logger.error(f"Error processing session {session_id}: {str(e)}")
-            
+            logger.error("Error processing session %s: %s", session_id, e)
+
+            # The save may still be in flight if the failure happened
+            # before the join above - resolve it so the row it inserted
+            # does not sit in 'processing' forever
+            if session_id is None and save_future is not None:
+                try:
+                    session_id = save_future.result(timeout=30)
+                except Exception as save_error:
+                    logger.error("Background session save failed: %s", save_error)
+
             # Update session status to error if session was created
             if session_id:
                 self.db_service.update_session_status(session_id, SessionStatus.ERROR)
@@ -150,48 +262,53 @@ class TranscriptionService:
             }
             
         finally:
-            # Clean up temporary file
-            if temp_path and os.path.exists(temp_path):
+            # Clean up temporary file (caller-owned paths are left alone)
+            if owns_temp and temp_path and os.path.exists(temp_path):
                 try:
                     os.unlink(temp_path)
-                    logger.info(f"Cleaned up temporary file: {temp_path}")
+                    logger.info("Cleaned up temporary file: %s", temp_path)
                 except Exception as e:
-                    logger.warning(f"Failed to clean up temporary file {temp_path}: {str(e)}")
+                    logger.warning("Failed to clean up temporary file %s: %s", temp_path, e)
     
     def _calculate_average_confidence(self, segments: List[Dict]) -> float:
         """Calculate average confidence from segments"""
         if not segments:
             return 0.0
-        
-        total_confidence = sum(segment.get('confidence', 0.0) for segment in segments)
-        return total_confidence / len(segments)
+
+        confidences = np.fromiter(
+            (segment.get('confidence', 0.0) for segment in segments),
+            dtype=np.float32, count=len(segments)
+        )
+        return float(confidences.mean())
     
     def _convert_segments(self, segments: List[Dict]) -> List[AudioSegment]:
         """Convert raw segments to AudioSegment objects"""
-        audio_segments = []
-        
-        for i, segment in enumerate(segments):
-            # Determine speaker type from segment data
-            speaker_type = SpeakerType.OTHER
-            if 'speaker' in segment:
-                speaker_str = segment['speaker'].lower()
-                if 'doctor' in speaker_str or 'dr' in speaker_str:
-                    speaker_type = SpeakerType.DOCTOR
-                elif 'patient' in speaker_str:
-                    speaker_type = SpeakerType.PATIENT
-            
-            audio_segment = AudioSegment(
-                speaker_type=speaker_type,
+        if not segments:
+            return []
+
+        # Classify all speakers in one vectorized pass instead of running
+        # substring checks per iteration; construction then zips the
+        # precomputed types with the source dicts. The masks reduce to
+        # integer codes indexed into a plain tuple - np.where over the
+        # enum members themselves would coerce them into a fixed-width
+        # unicode array and hand back truncated strings, not SpeakerType
+        speakers = np.array([segment.get('speaker', '').lower() for segment in segments])
+        is_doctor = (np.char.find(speakers, 'doctor') >= 0) | (np.char.find(speakers, 'dr') >= 0)
+        is_patient = np.char.find(speakers, 'patient') >= 0
+        type_by_code = (SpeakerType.OTHER, SpeakerType.PATIENT, SpeakerType.DOCTOR)
+        codes = np.where(is_doctor, 2, np.where(is_patient, 1, 0))
+
+        return [
+            AudioSegment(
+                speaker_type=type_by_code[code],
                 start_time=segment.get('start', 0.0),
                 end_time=segment.get('end', 0.0),
                 text=segment.get('text', ''),
                 confidence=segment.get('confidence', 0.0),
                 segment_order=i
             )
-            
-            audio_segments.append(audio_segment)
-        
-        return audio_segments
+            for i, (segment, code) in enumerate(zip(segments, codes))
+        ]
     
     def get_session_with_transcription(self, session_id: int) -> Optional[Dict[str, Any]]:
         """Get complete session data with transcription"""
@@ -203,7 +320,7 @@ class TranscriptionService:
             return session.to_dict()
             
         except Exception as e:
-            logger.error(f"Error retrieving session {session_id}: {str(e)}")
+            logger.error("Error retrieving session %s: %s", session_id, e)
             return None
     
     def validate_audio_file(self, audio_filename: str, audio_size: int) -> Dict[str, Any]:
@@ -247,7 +364,7 @@ class TranscriptionService:
             return stats
             
         except Exception as e:
-            logger.error(f"Error retrieving processing stats: {str(e)}")
+            logger.error("Error retrieving processing stats: %s", e)
             return {}
 
 
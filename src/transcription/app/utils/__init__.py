@@ -5,9 +5,10 @@ Utilities module for MedTranscribe application
 from .logger import setup_logging, get_logger
 from .helpers import (
     format_file_size, format_duration, format_timestamp,
-    encode_audio_for_html, create_download_filename,
+    encode_audio_for_html, ensure_audio_cached, create_download_filename,
     validate_session_data, parse_transcription_text,
-    create_text_export, sanitize_input, get_date_range_filter
+    create_text_export, sanitize_input, get_date_range_filter,
+    messages_to_soa, MessagesSoA, spool_upload_to_file
 )
 
 __all__ = [
@@ -17,10 +18,14 @@ __all__ = [
     'format_duration', 
     'format_timestamp',
     'encode_audio_for_html',
+    'ensure_audio_cached',
     'create_download_filename',
     'validate_session_data',
     'parse_transcription_text',
     'create_text_export',
     'sanitize_input',
-    'get_date_range_filter'
-] 
\ No newline at end of file
+    'get_date_range_filter',
+    'messages_to_soa',
+    'MessagesSoA',
+    'spool_upload_to_file'
+]
\ No newline at end of file
@@ -1,12 +1,30 @@
 """
 Helper utility functions for MedTranscribe application
 """
-import base64
 import hashlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+try:
+    # SIMD-accelerated base64 (AVX2/SSSE3) - multi-MB audio blobs encode
+    # several times faster than the stdlib scalar loop
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+import re
+from collections import namedtuple
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+# Struct-of-arrays form of a message list: three parallel lists instead of
+# one dict per message, so hot render loops skip per-message dict lookups
+MessagesSoA = namedtuple('MessagesSoA', ['is_doctor', 'text', 'timestamp'])
+
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format"""
@@ -56,24 +74,128 @@ def format_timestamp(dt: datetime) -> str:
         return dt.strftime('%Y-%m-%d %H:%M')
 
 
-def generate_file_hash(file_data: bytes) -> str:
-    """Generate SHA-256 hash for file data"""
-    return hashlib.sha256(file_data).hexdigest()
+def generate_file_hash(file_data) -> str:
+    """Generate SHA-256 hash for file data
+
+    Accepts bytes or a binary file object. File objects are hashed in 1 MiB
+    chunks so large uploads never need a second full in-memory copy.
+    """
+    if isinstance(file_data, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(file_data).hexdigest()
+
+    h = hashlib.sha256()
+    for chunk in iter(lambda: file_data.read(1 << 20), b''):
+        h.update(chunk)
+    return h.hexdigest()
+
+
+def spool_upload_to_file(uploaded_file, dst) -> None:
+    """Copy an uploaded file into dst without a userland pass when possible
+
+    Disk-spooled uploads are spliced kernel-to-kernel via sendfile(2).
+    A single sendfile call may transfer fewer bytes than requested
+    (signal delivery, internal caps), so the offset advances in a loop
+    until the source is drained - a partial copy would silently truncate
+    the audio. In-memory uploads with no usable fd fall back to a
+    chunked userland copy; dst is rewound first so bytes from a partial
+    splice are never left in front of the fallback's output.
+    """
+    try:
+        src_fd = uploaded_file.fileno()
+        remaining = os.fstat(src_fd).st_size
+        offset = 0
+        while remaining > 0:
+            sent = os.sendfile(dst.fileno(), src_fd, offset, remaining)
+            if sent == 0:
+                raise OSError("sendfile drained early at offset %d" % offset)
+            offset += sent
+            remaining -= sent
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        dst.seek(0)
+        dst.truncate()
+        uploaded_file.seek(0)
+        shutil.copyfileobj(uploaded_file, dst, length=1 << 20)
+
+
+_audio_cache_lock = threading.Lock()
+_last_audio_sweep = 0.0
+_AUDIO_SWEEP_INTERVAL = 300  # seconds between cache sweeps
+
+
+def _sweep_audio_cache(audio_dir: Path, ttl: float) -> None:
+    """Delete cached audio not played back within ttl seconds
+
+    Keeps patient audio from accumulating on disk indefinitely; mtime is
+    refreshed on every cache hit, so only idle entries are removed.
+    """
+    cutoff = time.time() - ttl
+    for path in audio_dir.iterdir():
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass  # already gone or being replaced - skip it
+
+
+def ensure_audio_cached(session_id: int, audio_data: bytes, filename: str) -> Path:
+    """Write audio data to the on-disk cache once and return the cached path
+
+    Base64 data URIs re-encode the whole blob on every rerun; serving the
+    cached file instead pays one disk write on first render and nothing
+    after. The name embeds a content hash so changed audio - even at the
+    same size - never serves stale bytes, and the write lands via a temp
+    name plus os.replace under a lock so a concurrent first render can't
+    hand the player a half-written file. Idle entries are swept once the
+    configured TTL passes.
+    """
+    from ..config import AUDIO_DIR, current_config
+
+    global _last_audio_sweep
+
+    safe_name = Path(filename).name or "audio.mp3"
+    digest = generate_file_hash(audio_data)[:16]
+    cached_path = AUDIO_DIR / f"{session_id}_{digest}_{safe_name}"
+
+    with _audio_cache_lock:
+        now = time.time()
+        if now - _last_audio_sweep >= _AUDIO_SWEEP_INTERVAL:
+            _last_audio_sweep = now
+            _sweep_audio_cache(AUDIO_DIR, current_config.AUDIO_CACHE_TTL_SECONDS)
+
+        if cached_path.exists():
+            # Refresh mtime so audio still being played back outlives the sweep
+            os.utime(cached_path)
+        else:
+            fd, tmp_name = tempfile.mkstemp(dir=AUDIO_DIR, suffix=".part")
+            try:
+                with os.fdopen(fd, 'wb') as tmp:
+                    tmp.write(audio_data)
+                os.replace(tmp_name, cached_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+
+    return cached_path
+
+
+_MIME_BY_EXT = {
+    '.mp3': 'audio/mpeg',
+    '.wav': 'audio/wav',
+    '.m4a': 'audio/mp4',
+    '.mp4': 'audio/mp4'
+}
 
 
 def encode_audio_for_html(audio_data: bytes, filename: str) -> str:
     """Encode audio data for HTML5 audio player"""
-    b64_audio = base64.b64encode(audio_data).decode()
-    file_extension = Path(filename).suffix.lower()
-    
-    # Determine MIME type
-    mime_type = {
-        '.mp3': 'audio/mpeg',
-        '.wav': 'audio/wav',
-        '.m4a': 'audio/mp4',
-        '.mp4': 'audio/mp4'
-    }.get(file_extension, 'audio/mpeg')
-    
+    b64_audio = _b64encode(audio_data).decode('ascii')
+    # splitext avoids a Path object allocation on every render
+    file_extension = os.path.splitext(filename)[1].lower()
+    mime_type = _MIME_BY_EXT.get(file_extension, 'audio/mpeg')
+
     return f"data:{mime_type};base64,{b64_audio}"
 
 
@@ -128,6 +250,12 @@ def validate_session_data(session_data: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+# Precompiled speaker-line matcher - one C-level scan per line instead of
+# six Python substring searches over an indicator list rebuilt (and
+# re-uppercased) every iteration
+_SPEAKER_RE = re.compile(r'DOCTOR|PATIENT|PERSON [12]', re.IGNORECASE)
+
+
 def parse_transcription_text(transcription_text: str) -> List[Dict[str, Any]]:
     """Parse transcription text into messages"""
     if not transcription_text:
@@ -136,52 +264,68 @@ def parse_transcription_text(transcription_text: str) -> List[Dict[str, Any]]:
     lines = transcription_text.split('\n')
     messages = []
     current_speaker = None
-    current_message = ""
-    
+    # Accumulate message lines in a list and join at flush points -
+    # repeated str += is quadratic in message length
+    current_parts = []
+
     for line in lines:
         line = line.strip()
         if not line or line.startswith('=') or line.startswith('📁') or line.startswith('⏰') or line.startswith('🤖'):
             continue
-        
-        # Detect speaker changes
-        speaker_indicators = ['👨‍⚕️ DOCTOR', '🧑‍🤝‍🧑 PATIENT', 'DOCTOR', 'PATIENT', 'Person 1', 'Person 2']
-        is_speaker_line = any(indicator in line.upper() for indicator in [s.upper() for s in speaker_indicators])
-        
+
+        # Detect speaker changes (emoji-prefixed headers match too since they
+        # contain DOCTOR/PATIENT as substrings)
+        is_speaker_line = _SPEAKER_RE.search(line) is not None
+
         if is_speaker_line or '[' in line and ']:' in line:
             # Save previous message
-            if current_speaker and current_message:
+            if current_speaker and current_parts:
                 is_doctor = any(d in current_speaker.upper() for d in ['DOCTOR', 'DR.'])
                 messages.append({
                     'speaker': current_speaker,
-                    'text': current_message.strip(),
+                    'text': ' '.join(current_parts),
                     'is_doctor': is_doctor,
                     'timestamp': datetime.now().strftime('%H:%M')
                 })
-            
+
             # Start new message
             current_speaker = line
-            current_message = ""
+            current_parts = []
         elif line.strip() and not line.startswith('📊'):
             # Message content
             if line.startswith('   ') or current_speaker:
-                current_message += line.strip() + " "
-    
+                current_parts.append(line.strip())
+
     # Add final message
-    if current_speaker and current_message:
+    if current_speaker and current_parts:
         is_doctor = any(d in current_speaker.upper() for d in ['DOCTOR', 'DR.'])
         messages.append({
             'speaker': current_speaker,
-            'text': current_message.strip(),
+            'text': ' '.join(current_parts),
             'is_doctor': is_doctor,
             'timestamp': datetime.now().strftime('%H:%M')
         })
-    
+
     return messages
 
 
+def messages_to_soa(messages: List[Dict[str, Any]]) -> MessagesSoA:
+    """Convert list-of-dict messages into struct-of-arrays form"""
+    is_doctor = []
+    text = []
+    timestamp = []
+
+    for message in messages:
+        is_doctor.append(message.get('is_doctor', False))
+        text.append(message.get('text', '').strip())
+        timestamp.append(message.get('timestamp'))
+
+    return MessagesSoA(is_doctor, text, timestamp)
+
+
 def create_text_export(session_data: Dict[str, Any], messages: List[Dict[str, Any]]) -> str:
     """Create text export of conversation"""
-    output = f"""Medical Consultation Transcript
+    parts = [f"""Medical Consultation Transcript
 =====================================
 Patient: {session_data.get('patient_name', 'Unknown')}
 Doctor: {session_data.get('doctor_name', 'Unknown')}
@@ -191,8 +335,8 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 Conversation:
 =============
 
-"""
-    
+"""]
+
     for message in messages:
         # Extract clean speaker name
         speaker_name = message['speaker']
@@ -206,17 +350,17 @@ Conversation:
         text = message.get('text', '').strip()
         
         if timestamp:
-            output += f"[{timestamp}] {speaker_name}: {text}\n\n"
+            parts.append(f"[{timestamp}] {speaker_name}: {text}\n\n")
         else:
-            output += f"{speaker_name}: {text}\n\n"
-    
-    output += f"""
+            parts.append(f"{speaker_name}: {text}\n\n")
+
+    parts.append(f"""
 =====================================
 End of Transcript
 Generated on {datetime.now().strftime('%Y-%m-%d at %H:%M:%S')}
-"""
-    
-    return output
+""")
+
+    return ''.join(parts)
 
 
 def sanitize_input(text: str, max_length: int = 1000) -> str:
@@ -234,15 +378,16 @@ def sanitize_input(text: str, max_length: int = 1000) -> str:
     return text
 
 
+# Dispatch table keyed by filter name; each entry maps "now" to its cutoff
+_DATE_FILTERS = {
+    "today": lambda now: now.date(),
+    "yesterday": lambda now: (now - timedelta(days=1)).date(),
+    "last_7_days": lambda now: now - timedelta(days=7),
+    "last_30_days": lambda now: now - timedelta(days=30),
+}
+
+
 def get_date_range_filter(filter_type: str) -> Optional[datetime]:
     """Get date filter based on type"""
-    if filter_type == "today":
-        return datetime.now().date()
-    elif filter_type == "yesterday":
-        return (datetime.now() - timedelta(days=1)).date()
-    elif filter_type == "last_7_days":
-        return datetime.now() - timedelta(days=7)
-    elif filter_type == "last_30_days":
-        return datetime.now() - timedelta(days=30)
-    
-    return None 
\ No newline at end of file
+    get_cutoff = _DATE_FILTERS.get(filter_type)
+    return get_cutoff(datetime.now()) if get_cutoff else None
@@ -6,6 +6,27 @@ import logging.handlers
 from pathlib import Path
 from ..config import current_config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Emit one structured JSON object per record for the file handler
+
+    orjson serializes several times faster than stdlib json; plain-text
+    formatting stays in place when it isn't installed.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        return orjson.dumps({
+            'time': self.formatTime(record),
+            'name': record.name,
+            'level': record.levelname,
+            'message': record.getMessage()
+        }).decode()
+
 
 def setup_logging():
     """Setup application logging configuration"""
@@ -38,7 +59,10 @@ def setup_logging():
         backupCount=5
     )
     file_handler.setLevel(getattr(logging, current_config.LOG_LEVEL))
-    file_formatter = logging.Formatter(current_config.LOG_FORMAT)
+    if orjson is not None:
+        file_formatter = JsonFormatter()
+    else:
+        file_formatter = logging.Formatter(current_config.LOG_FORMAT)
     file_handler.setFormatter(file_formatter)
     logger.addHandler(file_handler)
     
@@ -1,7 +1,12 @@
+import asyncio
 import os
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
 from typing import Dict, Any, Union
+import httpx
 from dotenv import load_dotenv
 from openai import OpenAI
 from langchain.prompts import PromptTemplate
@@ -22,6 +27,19 @@ OPENROUTER_SITE_URL = os.getenv("OPENROUTER_SITE_URL", "")
 OPENROUTER_SITE_NAME = os.getenv("OPENROUTER_SITE_NAME", "")
 DEFAULT_TEMP = 0.0
 
+_VAR_RE = re.compile(r'\{([^{}]*)\}')
+
+@lru_cache(maxsize=256)
+def _compile_template(template_str: str) -> PromptTemplate:
+    """Build a PromptTemplate from a raw string, memoized per template
+
+    Templates are a small fixed set in practice, so the variable-extraction
+    regex and PromptTemplate construction run once per distinct string
+    instead of on every chain invocation.
+    """
+    variables = list(set(_VAR_RE.findall(template_str)))
+    return PromptTemplate(template=template_str, input_variables=variables)
+
 class LLMService:
     def __init__(self, temperature=DEFAULT_TEMP, max_retries=3, 
                  retry_delay=2, model=OPENROUTER_MODEL):
@@ -36,15 +54,21 @@ class LLMService:
     
     def _initialize_client(self):
         try:
+            # Explicit keep-alive pool: retries and successive prompts reuse
+            # warm TLS connections instead of paying a handshake each time
             self.client = OpenAI(
                 base_url="https://openrouter.ai/api/v1",
-                api_key=OPENROUTER_API_KEY
+                api_key=OPENROUTER_API_KEY,
+                http_client=httpx.Client(
+                    limits=httpx.Limits(max_keepalive_connections=32),
+                    timeout=60
+                )
             )
             # Use print to ensure this message is shown regardless of logging level
             print(f"Initialized OpenRouter with model: {self.model} (temp: {self.temperature})")
-            logger.info(f"Initialized OpenRouter with model: {self.model} (temp: {self.temperature})")
+            logger.info("Initialized OpenRouter with model: %s (temp: %s)", self.model, self.temperature)
         except Exception as e:
-            logger.error(f"Failed to initialize OpenRouter: {e}")
+            logger.error("Failed to initialize OpenRouter: %s", e)
             raise ValueError(f"Failed to initialize client: {e}")
     
     def set_model(self, model_name: str):
@@ -52,14 +76,14 @@ class LLMService:
             self.model = model_name
             # Use print to ensure this message is shown regardless of logging level
             print(f"Updated model to: {model_name}")
-            logger.info(f"Updated model to: {model_name}")
+            logger.info("Updated model to: %s", model_name)
             return True
         return False
     
     def set_temperature(self, temperature: float):
         if temperature is not None and temperature != self.temperature:
             self.temperature = temperature
-            logger.info(f"Updated temperature to: {temperature}")
+            logger.info("Updated temperature to: %s", temperature)
             return True
         return False
     
@@ -93,19 +117,36 @@ class LLMService:
                 return response.choices[0].message.content.strip()
             except Exception as e:
                 if attempt < self.max_retries:
-                    logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying...")
-                    time.sleep(self.retry_delay)
+                    logger.warning("Attempt %s failed: %s. Retrying...", attempt + 1, e)
+                    time.sleep(self.retry_delay * 2 ** attempt)
                 else:
                     raise Exception(f"Failed after {self.max_retries} attempts: {e}")
     
+    def generate_batch(self, prompts, image_url: str = None, max_workers: int = 8):
+        """Run a list of prompts concurrently over the shared connection pool
+
+        Each prompt keeps full per-request latency, but N prompts complete
+        in roughly the time of one instead of N; results come back in
+        input order.
+        """
+        if not prompts:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as pool:
+            return list(pool.map(
+                lambda prompt: self.generate_response(prompt, image_url), prompts
+            ))
+
+    async def agenerate_response(self, prompt: Union[str, Dict], image_url: str = None):
+        """Async wrapper so callers can gather several prompts concurrently
+
+        Runs the pooled sync client on a worker thread; concurrent calls
+        share keep-alive connections instead of serializing on one thread.
+        """
+        return await asyncio.to_thread(self.generate_response, prompt, image_url)
+
     def invoke_chain(self, prompt_template: Union[str, PromptTemplate], inputs: Dict[str, Any]):
         if isinstance(prompt_template, str):
-            import re
-            variables = list(set(re.findall(r'\{([^{}]*)\}', prompt_template)))
-            prompt_template = PromptTemplate(
-                template=prompt_template,
-                input_variables=variables
-            )
+            prompt_template = _compile_template(prompt_template)
         formatted_prompt = prompt_template.format(**inputs)
         return self.generate_response(formatted_prompt)
 
@@ -125,5 +166,8 @@ def set_temperature(temperature: float):
 def generate_response(prompt: Union[str, Dict], image_url: str = None):
     return llm_service.generate_response(prompt, image_url)
 
+def generate_batch(prompts, image_url: str = None):
+    return llm_service.generate_batch(prompts, image_url)
+
 def process_prompt(prompt_template: Union[str, PromptTemplate], inputs: Dict[str, Any]):
     return llm_service.process_prompt(prompt_template, inputs)
\ No newline at end of file
@@ -5,8 +5,10 @@ This file avoids all circular imports by using absolute imports and lazy loading
 import streamlit as st
 import sys
 import os
+import tempfile
 import time
-from datetime import datetime
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
@@ -22,8 +24,12 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Structural CSS only - the color palette lives in .streamlit/config.toml
+# [theme] so it ships with no runtime payload. This block is emitted every
+# run on purpose: Streamlit prunes elements that are not re-rendered on a
+# rerun, so a session_state one-shot guard would drop the styles after the
+# first interaction.
+_APP_CSS = """
 <style>
 .main > div {
     padding-top: 2rem;
@@ -57,71 +63,206 @@ st.markdown("""
 footer {visibility: hidden;}
 .stDeployButton {display:none;}
 </style>
-""", unsafe_allow_html=True)
+"""
+st.markdown(_APP_CSS, unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=1)
+def _services():
+    """Resolve the app-layer imports once and hand back cached bindings
+
+    Imports stay lazy (this file deliberately avoids importing the app
+    package at module load to dodge circular imports), but reruns after
+    the first get a tuple from the cache instead of re-walking the import
+    machinery in every render function.
+    """
+    from app.services.database_service import db_service
+    from app.models import SessionFilter
+    return db_service, SessionFilter
+
+
+def _fmt_duration(seconds: float) -> str:
+    """Format seconds as MM:SS - one strftime C call on the sub-hour path
+
+    Sessions over an hour keep the old overflowing-minutes style (e.g.
+    75:30) that gmtime would otherwise wrap.
+    """
+    if seconds < 3600:
+        return time.strftime("%M:%S", time.gmtime(seconds))
+    return f"{int(seconds) // 60:02d}:{int(seconds) % 60:02d}"
+
+
+_STATUS_COLORS = {
+    'completed': '🟢',
+    'processing': '🟡',
+    'pending': '🔴',
+    'error': '❌'
+}
+
+
+@lru_cache(maxsize=None)
+def _status_label(status) -> str:
+    """Resolve a status (enum or raw string) to its icon-plus-title label
+
+    Memoized on the handful of distinct statuses, so the per-row cost is
+    one dict hit instead of getattr + lookup + title() every time.
+    """
+    value = getattr(status, 'value', str(status))
+    return f"{_STATUS_COLORS.get(value, '⚪')} {value.title()}"
+
+
+def _render_session_row(session) -> str:
+    """Render the three-column session row shared by both views
+
+    Returns the resolved status string so callers can reuse it without
+    repeating the enum unwrapping.
+    """
+    col1, col2, col3 = st.columns([3, 2, 1])
+
+    with col1:
+        st.markdown(f"**{session.patient_name}**")
+        st.markdown(f"Dr. {session.doctor_name}")
+
+    with col2:
+        st.markdown(f"📅 {session.session_date}")
+        if session.duration:
+            st.markdown(f"⏰ {_fmt_duration(session.duration)}")
+
+    with col3:
+        status = getattr(session.status, 'value', str(session.status))
+        st.markdown(_status_label(session.status))
+
+    return status
+
+
+@st.cache_resource(show_spinner=False)
+def _warm_default_model():
+    """Start loading the default Whisper model once per server process
 
+    cache_resource makes this a process-wide one-shot; the daemon thread
+    keeps the first page render snappy while the weights load.
+    """
+    import threading
 
-def process_uploaded_audio(upload_data: Dict[str, Any]):
+    def _preload():
+        try:
+            from app.services.transcription_service import transcription_service
+            transcription_service.warm_model("base")
+        except Exception:
+            pass  # first upload falls back to loading on demand
+
+    thread = threading.Thread(target=_preload, daemon=True)
+    thread.start()
+    return thread
+
+
+_warm_default_model()
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_bundle() -> Dict[str, Any]:
+    """Fetch stats plus recent sessions in one cached round trip
+
+    The sidebar, dashboard and transcription views all read from this
+    bundle, so a rerun costs at most one DB visit per TTL window instead
+    of three separate queries.
+    """
+    db_service, _ = _services()
+    return db_service.get_dashboard_bundle(limit=20)
+
+
+def _cached_stats() -> Dict[str, Any]:
+    return _cached_bundle()['stats']
+
+
+def _cached_sessions(limit: int):
+    return _cached_bundle()['recent'][:limit]
+
+
+@dataclass(slots=True)
+class UploadPayload:
+    """Typed upload-form payload
+
+    Attribute access on a slots struct beats the string-hashed dict
+    lookups the processing path used to do for every field.
+    """
+    patient_name: str
+    doctor_name: str
+    session_date: str
+    session_notes: str
+    model_size: str
+    uploaded_file: Any
+
+
+def process_uploaded_audio(payload: UploadPayload):
     """Process uploaded audio file using transcription service"""
     try:
-        # Validate session data
-        session_data = {
-            'patient_name': upload_data['patient_name'],
-            'doctor_name': upload_data['doctor_name'],
-            'session_date': upload_data['session_date'],
-            'session_notes': upload_data['session_notes']
-        }
-        
         # Basic validation
-        if not session_data['patient_name'] or not session_data['doctor_name']:
+        if not payload.patient_name or not payload.doctor_name:
             st.error("Patient name and doctor name are required.")
             return
-        
+
+        # Built once, only at the service boundary
+        session_data = {
+            'patient_name': payload.patient_name,
+            'doctor_name': payload.doctor_name,
+            'session_date': payload.session_date,
+            'session_notes': payload.session_notes
+        }
+
         # Get uploaded file
-        uploaded_file = upload_data['uploaded_file']
-        audio_data = uploaded_file.read()
-        
-        # Check file size
+        uploaded_file = payload.uploaded_file
+
+        # Check file size before touching the payload
         max_size_mb = 100
-        if len(audio_data) > max_size_mb * 1024 * 1024:
+        if uploaded_file.size > max_size_mb * 1024 * 1024:
             st.error(f"File too large. Maximum size: {max_size_mb}MB")
             return
-        
+
+        # Stream the upload to disk instead of reading it into memory -
+        # the service mmaps/decodes from the path, so the server process
+        # never holds the whole blob as a bytes object
+        from app.utils import spool_upload_to_file
+        with tempfile.NamedTemporaryFile(suffix=Path(uploaded_file.name).suffix, delete=False) as tmp:
+            # Looped sendfile with a userland fallback - a single call may
+            # copy short and silently truncate the audio
+            spool_upload_to_file(uploaded_file, tmp)
+            audio_path = tmp.name
+
         # Show processing status
         with st.container():
             st.info("🔄 Processing your audio file...")
             progress_bar = st.progress(0)
             status_text = st.empty()
-            
-            # Update progress simulation
-            for i in range(100):
-                progress_bar.progress(i / 100)
-                if i < 20:
-                    status_text.text("Initializing transcription...")
-                elif i < 40:
-                    status_text.text("Loading AI model...")
-                elif i < 70:
-                    status_text.text("Processing audio segments...")
-                elif i < 90:
-                    status_text.text("Analyzing speaker patterns...")
-                else:
-                    status_text.text("Finalizing transcription...")
-                time.sleep(0.03)
-            
+
+            # The bar tracks the service's real progress callbacks instead
+            # of a simulated countdown that added ~3s before any work began
+            def update_progress(fraction: float, message: str):
+                progress_bar.progress(min(max(fraction, 0.0), 1.0))
+                status_text.text(message)
+
             # Import and use transcription service
             try:
                 from app.services.transcription_service import transcription_service
-                
-                # Process the audio
-                result = transcription_service.process_audio_file(
-                    audio_data=audio_data,
-                    audio_filename=uploaded_file.name,
-                    session_details=session_data,
-                    model_size=upload_data['model_size']
-                )
-                
+
+                # Process the audio from the on-disk copy
+                try:
+                    result = transcription_service.process_audio_file(
+                        audio_path=audio_path,
+                        audio_filename=uploaded_file.name,
+                        session_details=session_data,
+                        model_size=payload.model_size,
+                        progress_cb=update_progress
+                    )
+                finally:
+                    if os.path.exists(audio_path):
+                        os.unlink(audio_path)
+
                 progress_bar.progress(100)
                 
                 if result['success']:
+                    # New session must show up immediately, not after TTL
+                    _cached_bundle.clear()
                     status_text.text("✅ Transcription completed successfully!")
                     st.success(f"Audio file processed successfully! Session ID: {result.get('session', {}).get('id', 'N/A')}")
                     
@@ -190,9 +331,7 @@ def render_sidebar():
         # System status
         st.markdown("### 📊 System Status")
         try:
-            # Import database service directly
-            from app.services.database_service import db_service
-            stats = db_service.get_stats()
+            stats = _cached_stats()
             st.metric("Total Sessions", stats.get('total_sessions', 0))
             st.metric("This Month", stats.get('this_month', 0))
             st.success("🟢 System Online")
@@ -208,12 +347,8 @@ def render_simple_dashboard():
     st.title("🏥 MedTranscribe Dashboard")
     
     try:
-        # Import services directly
-        from app.services.database_service import db_service
-        from app.models import SessionFilter
-        
         # Get statistics
-        stats = db_service.get_stats()
+        stats = _cached_stats()
         
         # Stats cards
         col1, col2, col3, col4 = st.columns(4)
@@ -236,35 +371,23 @@ def render_simple_dashboard():
         st.subheader("📋 Recent Sessions")
         
         # Get recent sessions
-        session_filter = SessionFilter(limit=10)
-        recent_sessions = db_service.get_sessions(session_filter)
+        recent_sessions = _cached_sessions(limit=10)
         
         if recent_sessions:
-            for session in recent_sessions:
-                with st.container():
-                    col1, col2, col3 = st.columns([3, 2, 1])
-                    
-                    with col1:
-                        st.markdown(f"**{session.patient_name}**")
-                        st.markdown(f"Dr. {session.doctor_name}")
-                    
-                    with col2:
-                        st.markdown(f"📅 {session.session_date}")
-                        if session.duration:
-                            duration_str = f"{int(session.duration // 60):02d}:{int(session.duration % 60):02d}"
-                            st.markdown(f"⏰ {duration_str}")
-                    
-                    with col3:
-                        status_colors = {
-                            'completed': '🟢',
-                            'processing': '🟡', 
-                            'pending': '🔴',
-                            'error': '❌'
-                        }
-                        status = session.status.value if hasattr(session.status, 'value') else str(session.status)
-                        st.markdown(f"{status_colors.get(status, '⚪')} {status.title()}")
-                    
-                    st.divider()
+            # One Arrow payload instead of ~5 widget nodes per row - the
+            # dashboard list is display-only so no per-row buttons needed
+            import pandas as pd
+            frame = pd.DataFrame([
+                {
+                    'Patient': session.patient_name,
+                    'Doctor': session.doctor_name,
+                    'Date': session.session_date,
+                    'Duration': _fmt_duration(session.duration) if session.duration else '—',
+                    'Status': _status_label(session.status)
+                }
+                for session in recent_sessions
+            ])
+            st.dataframe(frame, hide_index=True, use_container_width=True)
         else:
             st.info("No sessions found. Upload your first audio file to get started!")
     
@@ -311,113 +434,96 @@ def render_simple_transcription():
                     # Convert date to string properly
                     session_date_str = session_date.isoformat() if hasattr(session_date, 'isoformat') else str(session_date)
                     
-                    process_uploaded_audio({
-                        'patient_name': patient_name,
-                        'doctor_name': doctor_name,
-                        'session_date': session_date_str,
-                        'session_notes': session_notes,
-                        'model_size': model_size,
-                        'uploaded_file': uploaded_file
-                    })
+                    process_uploaded_audio(UploadPayload(
+                        patient_name=patient_name,
+                        doctor_name=doctor_name,
+                        session_date=session_date_str,
+                        session_notes=session_notes,
+                        model_size=model_size,
+                        uploaded_file=uploaded_file
+                    ))
     
     with col2:
-        st.subheader("📋 Recent Sessions")
+        _sessions_fragment()
+
+
+@st.fragment
+def _sessions_fragment():
+    """Recent-sessions column, isolated so clicks rerun only this block
+
+    Without the fragment, every View Details click re-executed the whole
+    script - sidebar stats query, CSS injection and the upload form
+    included.
+    """
+    st.subheader("📋 Recent Sessions")
+
+    try:
+        db_service, _ = _services()
+        sessions = _cached_sessions(limit=20)
         
-        try:
-            from app.services.database_service import db_service
-            from app.models import SessionFilter
-            
-            session_filter = SessionFilter(limit=20)
-            sessions = db_service.get_sessions(session_filter)
-            
-            if sessions:
-                for session in sessions:
-                    with st.container():
-                        col1, col2, col3 = st.columns([3, 2, 1])
-                        
-                        with col1:
-                            st.markdown(f"**{session.patient_name}**")
-                            st.markdown(f"Dr. {session.doctor_name}")
-                        
-                        with col2:
-                            st.markdown(f"📅 {session.session_date}")
-                            if hasattr(session, 'duration') and session.duration:
-                                duration_str = f"{int(session.duration // 60):02d}:{int(session.duration % 60):02d}"
-                                st.markdown(f"⏰ {duration_str}")
-                        
-                        with col3:
-                            status = session.status.value if hasattr(session.status, 'value') else str(session.status)
-                            status_colors = {
-                                'completed': '🟢',
-                                'processing': '🟡', 
-                                'pending': '🔴',
-                                'error': '❌'
-                            }
-                            st.markdown(f"{status_colors.get(status, '⚪')} {status.title()}")
+        if sessions:
+            for session in sessions:
+                with st.container():
+                    status = _render_session_row(session)
+
+                    # Use enhanced session details component
+                    try:
+                        from app.components.ui_components import render_enhanced_session_details
+                        render_enhanced_session_details(session)
+                    except ImportError:
+                        # Fallback to simple details. Keys are stable per
+                        # session - a timestamp suffix would re-mount every
+                        # widget on each rerun and reset their state
+                        if st.button(f"View Details", key=f"view_transcription_{session.id}"):
+                            st.session_state.selected_session = session.id
+                            st.rerun()
                         
-                        # Use enhanced session details component
-                        try:
-                            from app.components.ui_components import render_enhanced_session_details
-                            render_enhanced_session_details(session)
-                        except ImportError:
-                            # Fallback to simple details
-                            import time
-                            unique_suffix = f"{session.id}_{int(time.time() * 1000)}"
-                            
-                            if st.button(f"View Details", key=f"view_transcription_{unique_suffix}"):
-                                st.session_state.selected_session = session.id
+                        # Show session details if selected
+                        if hasattr(st.session_state, 'selected_session') and st.session_state.selected_session == session.id:
+                            with st.expander(f"Session Details - {session.patient_name}", expanded=True):
+                                st.write(f"**Patient:** {session.patient_name}")
+                                st.write(f"**Doctor:** {session.doctor_name}")
+                                st.write(f"**Date:** {session.session_date}")
+                                st.write(f"**Status:** {status.title()}")
+                                if hasattr(session, 'session_notes') and session.session_notes:
+                                    st.write(f"**Notes:** {session.session_notes}")
+                                
+                                # Try to get transcription
+                                try:
+                                    transcription = db_service.get_transcription_by_session_id(session.id)
+                                    if transcription and transcription.transcription_text:
+                                        st.subheader("💬 Transcription")
+                                        st.text_area("Conversation", transcription.transcription_text, height=300, key=f"transcription_text_{session.id}")
+                                        
+                                        # Download button
+                                        st.download_button(
+                                            label="📥 Download Transcript",
+                                            data=transcription.transcription_text,
+                                            file_name=f"transcript_{session.patient_name}_{session.session_date}.txt",
+                                            mime="text/plain",
+                                            key=f"download_file_{session.id}"
+                                        )
+                                    else:
+                                        st.info("No transcription available yet.")
+                                except:
+                                    st.info("Transcription data not available.")
+                                
+                                if st.button("🔙 Close Details", key=f"close_details_{session.id}"):
+                                    if hasattr(st.session_state, 'selected_session'):
+                                        delattr(st.session_state, 'selected_session')
                                 st.rerun()
-                            
-                            # Show session details if selected
-                            if hasattr(st.session_state, 'selected_session') and st.session_state.selected_session == session.id:
-                                with st.expander(f"Session Details - {session.patient_name}", expanded=True):
-                                    st.write(f"**Patient:** {session.patient_name}")
-                                    st.write(f"**Doctor:** {session.doctor_name}")
-                                    st.write(f"**Date:** {session.session_date}")
-                                    st.write(f"**Status:** {status.title()}")
-                                    if hasattr(session, 'session_notes') and session.session_notes:
-                                        st.write(f"**Notes:** {session.session_notes}")
-                                    
-                                    # Try to get transcription
-                                    try:
-                                        transcription = db_service.get_transcription_by_session_id(session.id)
-                                        if transcription and transcription.transcription_text:
-                                            st.subheader("💬 Transcription")
-                                            st.text_area("Conversation", transcription.transcription_text, height=300, key=f"transcription_text_{unique_suffix}")
-                                            
-                                            # Download button
-                                            st.download_button(
-                                                label="📥 Download Transcript",
-                                                data=transcription.transcription_text,
-                                                file_name=f"transcript_{session.patient_name}_{session.session_date}.txt",
-                                                mime="text/plain",
-                                                key=f"download_file_{unique_suffix}"
-                                            )
-                                        else:
-                                            st.info("No transcription available yet.")
-                                    except:
-                                        st.info("Transcription data not available.")
-                                    
-                                    if st.button("🔙 Close Details", key=f"close_details_{unique_suffix}"):
-                                        if hasattr(st.session_state, 'selected_session'):
-                                            delattr(st.session_state, 'selected_session')
-                                    st.rerun()
-                        
-                        st.divider()
-            else:
-                st.info("No sessions found.")
-        
-        except Exception as e:
-            st.error(f"Failed to load sessions: {str(e)}")
+                    
+                    st.divider()
+        else:
+            st.info("No sessions found.")
+    
+    except Exception as e:
+        st.error(f"Failed to load sessions: {str(e)}")
 
 
 def main():
     """Main application function"""
     try:
-        # Initialize logging
-        import logging
-        logging.basicConfig(level=logging.INFO)
-        
         # Render sidebar and get selected page
         selected_page = render_sidebar()
         
@@ -1,6 +1,8 @@
 """
 Basic tests for MedTranscribe application
 """
+import os
+import tempfile
 import unittest
 import sys
 from pathlib import Path
@@ -9,9 +11,15 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.config import Config, current_config
-from app.models import Session, SessionStatus, SpeakerType
+from app.models import Session, SessionStatus, SpeakerType, TranscriptionResult
 from app.utils import format_file_size, format_duration
 
+try:
+    import numpy  # noqa: F401
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 class TestBasicFunctionality(unittest.TestCase):
     """Test basic application functionality"""
@@ -39,13 +47,15 @@ class TestBasicFunctionality(unittest.TestCase):
     
     def test_utility_functions(self):
         """Test utility functions"""
-        # Test file size formatting
-        self.assertEqual(format_file_size(1024), "1.0 KB")
-        self.assertEqual(format_file_size(1048576), "1.0 MB")
-        
-        # Test duration formatting
-        self.assertEqual(format_duration(60), "01:00")
-        self.assertEqual(format_duration(125), "02:05")
+        # Parametrized via subTest so every case reports individually
+        # without a test method (and its setUp machinery) per case
+        for size_bytes, expected in [(1024, "1.0 KB"), (1048576, "1.0 MB")]:
+            with self.subTest(size_bytes=size_bytes):
+                self.assertEqual(format_file_size(size_bytes), expected)
+
+        for seconds, expected in [(60, "01:00"), (125, "02:05")]:
+            with self.subTest(seconds=seconds):
+                self.assertEqual(format_duration(seconds), expected)
     
     def test_speaker_types(self):
         """Test speaker type enum"""
@@ -74,5 +84,61 @@ class TestModelValidation(unittest.TestCase):
         self.assertIn('status', session_dict)
 
 
+@unittest.skipUnless(HAS_NUMPY, "transcription service requires numpy")
+class TestTranscriptionPersistence(unittest.TestCase):
+    """Test segment conversion and its round trip through the database"""
+
+    def test_convert_segments_round_trip(self):
+        """Converted segments carry real SpeakerType members and persist"""
+        from app.services.database_service import DatabaseService
+        from app.services.transcription_service import transcription_service
+
+        raw_segments = [
+            {'speaker': 'Doctor', 'start': 0.0, 'end': 2.5, 'text': 'How are you?', 'confidence': 0.95},
+            {'speaker': 'Patient', 'start': 2.5, 'end': 5.0, 'text': 'Fine, thanks.', 'confidence': 0.9},
+            {'speaker': 'Nurse', 'start': 5.0, 'end': 6.0, 'text': 'BP is normal.', 'confidence': 0.8},
+        ]
+
+        segments = transcription_service._convert_segments(raw_segments)
+
+        self.assertEqual(
+            [segment.speaker_type for segment in segments],
+            [SpeakerType.DOCTOR, SpeakerType.PATIENT, SpeakerType.OTHER]
+        )
+        for segment in segments:
+            self.assertIsInstance(segment.speaker_type, SpeakerType)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db = DatabaseService(db_path=os.path.join(tmp_dir, "test.db"))
+            try:
+                session_id = db.save_session(Session(
+                    patient_name="Test Patient",
+                    doctor_name="Dr. Test",
+                    session_date="2024-01-01",
+                    audio_filename="test.mp3",
+                    audio_data=b"audio",
+                    status=SessionStatus.PROCESSING
+                ))
+
+                transcription_id = db.save_transcription(TranscriptionResult(
+                    session_id=session_id,
+                    transcription_text="How are you? Fine, thanks. BP is normal.",
+                    segments=segments
+                ))
+                self.assertIsInstance(transcription_id, int)
+
+                saved_session = db.get_session_by_id(session_id)
+                self.assertEqual(saved_session.status, SessionStatus.COMPLETED)
+
+                saved = db.get_transcription_by_session_id(session_id)
+                self.assertEqual(len(saved.segments), 3)
+                self.assertEqual(
+                    [segment.speaker_type for segment in saved.segments],
+                    [SpeakerType.DOCTOR, SpeakerType.PATIENT, SpeakerType.OTHER]
+                )
+            finally:
+                db.close()
+
+
 if __name__ == '__main__':
-    unittest.main() 
\ No newline at end of file
+    unittest.main()
\ No newline at end of file
@@ -1,4 +1,5 @@
 import whisper
+import numpy as np
 import os
 import subprocess
 import sys
@@ -8,6 +9,52 @@ from typing import Dict, List, Tuple, Optional
 import warnings
 warnings.filterwarnings("ignore")
 
+class _FasterWhisperAdapter:
+    """Adapts faster_whisper.WhisperModel to whisper's transcribe() dict
+
+    CTranslate2 runs the same checkpoints quantized (int8 on CPU,
+    int8_float16 on GPU), cutting weight bandwidth and memory to a
+    fraction of the fp32 PyTorch path. The adapter keeps the call site
+    identical so the rest of the pipeline is backend-agnostic.
+    """
+
+    def __init__(self, model_size: str):
+        from faster_whisper import WhisperModel
+
+        if torch.cuda.is_available():
+            self._model = WhisperModel(model_size, device="cuda",
+                                       compute_type="int8_float16")
+        else:
+            self._model = WhisperModel(model_size, device="cpu",
+                                       compute_type="int8")
+
+    def transcribe(self, audio, word_timestamps: bool = True, verbose: bool = False,
+                   fp16: bool = None, condition_on_previous_text: bool = True) -> Dict:
+        """Transcribe audio, returning whisper's result-dict shape"""
+        segments, info = self._model.transcribe(
+            audio,
+            word_timestamps=word_timestamps,
+            condition_on_previous_text=condition_on_previous_text
+        )
+
+        out_segments = []
+        text_parts = []
+        for seg in segments:
+            out_segments.append({
+                'start': seg.start,
+                'end': seg.end,
+                'text': seg.text,
+                'avg_logprob': seg.avg_logprob
+            })
+            text_parts.append(seg.text)
+
+        return {
+            'text': ''.join(text_parts),
+            'segments': out_segments,
+            'language': info.language
+        }
+
+
 class VoiceTranscriber:
     """
     Voice transcription system with speaker diarization for medical consultations.
@@ -71,26 +118,127 @@ class VoiceTranscriber:
         sys.exit(1)
     
     def _load_models(self) -> None:
-        """Load Whisper model for transcription"""
+        """Load Whisper model for transcription
+
+        Prefers the quantized CTranslate2 backend when faster-whisper is
+        installed and falls back to the PyTorch model otherwise.
+        """
         try:
             print(f"Loading Whisper model: {self.model_size}")
+            try:
+                self.whisper_model = _FasterWhisperAdapter(self.model_size)
+                print("✅ Models loaded successfully (CTranslate2, quantized)")
+                return
+            except ImportError:
+                pass
             self.whisper_model = whisper.load_model(self.model_size)
             print("✅ Models loaded successfully")
         except Exception as e:
             print(f"❌ Error loading models: {e}")
             sys.exit(1)
     
+    def _segment_audio(self, audio: np.ndarray, max_chunk_sec: float = 30.0,
+                       min_silence_sec: float = 0.1) -> List[Tuple[float, np.ndarray]]:
+        """Split a waveform into chunks of at most max_chunk_sec
+
+        Cuts are placed on energy dips of at least min_silence_sec so a
+        chunk boundary never lands mid-word. Returns (offset_seconds,
+        samples) pairs covering the whole file; a file shorter than one
+        window comes back as a single chunk.
+        """
+        sample_rate = whisper.audio.SAMPLE_RATE
+        frame_len = int(sample_rate * 0.03)  # 30 ms energy frames
+        n_frames = len(audio) // frame_len
+
+        if n_frames * 0.03 <= max_chunk_sec:
+            return [(0.0, audio)]
+
+        frames = audio[:n_frames * frame_len].reshape(n_frames, frame_len)
+        rms = np.sqrt((frames ** 2).mean(axis=1))
+        silence_threshold = max(float(rms.mean()) * 0.2, 1e-4)
+        silent = rms < silence_threshold
+
+        # Candidate cut points: centers of silence runs long enough to be
+        # an actual pause rather than a plosive gap
+        min_run = max(1, int(min_silence_sec / 0.03))
+        cut_frames = []
+        run_start = None
+        for i, is_silent in enumerate(silent):
+            if is_silent and run_start is None:
+                run_start = i
+            elif not is_silent and run_start is not None:
+                if i - run_start >= min_run:
+                    cut_frames.append((run_start + i) // 2)
+                run_start = None
+        if run_start is not None and n_frames - run_start >= min_run:
+            cut_frames.append((run_start + n_frames) // 2)
+
+        max_chunk_frames = int(max_chunk_sec / 0.03)
+        margin = max(1, min_run)  # frames of silence kept around speech
+        chunks = []
+        start = 0
+        while start < n_frames:
+            limit = start + max_chunk_frames
+            if limit >= n_frames:
+                end = n_frames
+            else:
+                # Prefer the last pause inside the window; fall back to a
+                # hard cut when speech runs the full 30s
+                in_window = [c for c in cut_frames if start < c <= limit]
+                end = in_window[-1] if in_window else limit
+
+            # Trim the chunk to its speech extent (plus a short margin)
+            # so the encoder isn't fed leading/trailing silence on top of
+            # the fixed 30s zero-padding; all-silence chunks are dropped
+            # outright
+            voiced = np.flatnonzero(~silent[start:end])
+            if voiced.size:
+                first = start + max(int(voiced[0]) - margin, 0)
+                last = start + min(int(voiced[-1]) + 1 + margin, end - start)
+                chunks.append((first * 0.03, audio[first * frame_len:last * frame_len]))
+            start = end
+
+        return chunks
+
     def _transcribe_audio(self) -> Dict:
-        """Transcribe audio using Whisper with word-level timestamps"""
+        """Transcribe audio using Whisper with word-level timestamps
+
+        The file is decoded once and split into <=30s chunks at silence
+        boundaries; each chunk is transcribed independently
+        (condition_on_previous_text=False removes the serial dependency
+        between windows) and its timestamps are rebased onto the file
+        timeline.
+        """
         try:
             print("🎵 Transcribing audio...")
-            result = self.whisper_model.transcribe(
-                self.audio_file,
-                word_timestamps=True,
-                verbose=False
-            )
+            audio = whisper.load_audio(self.audio_file)
+            fp16 = torch.cuda.is_available()
+            # The PyTorch backend computes the log-mel spectrogram on
+            # whatever device the input tensor lives on - handing it a CUDA
+            # tensor moves the STFT/mel stage off the CPU. The CTranslate2
+            # adapter does its own feature extraction and takes numpy as-is.
+            on_gpu = fp16 and not isinstance(self.whisper_model, _FasterWhisperAdapter)
+
+            merged = {'text': '', 'segments': [], 'language': None}
+            for offset_sec, chunk in self._segment_audio(audio):
+                if on_gpu:
+                    chunk = torch.from_numpy(chunk).cuda()
+                result = self.whisper_model.transcribe(
+                    chunk,
+                    word_timestamps=True,
+                    verbose=False,
+                    fp16=fp16,
+                    condition_on_previous_text=False
+                )
+                merged['language'] = merged['language'] or result.get('language')
+                merged['text'] += result.get('text', '')
+                for segment in result.get('segments', []):
+                    segment['start'] += offset_sec
+                    segment['end'] += offset_sec
+                    merged['segments'].append(segment)
+
             print("✅ Transcription completed")
-            return result
+            return merged
         except Exception as e:
             print(f"❌ Transcription error: {e}")
             raise